@@ -2,17 +2,21 @@
 from __future__ import annotations
 
 import argparse
+import queue
+import threading
 from time import perf_counter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import List, Tuple
 
 from src.instance_generator.presets import SMALL, MED, LARGE, GRID_FIXED2, GRID_FIXED1
+from src.instance_generator.config import PaperKnobs
 from src.instance_generator.generator import generate_instance
+from src.instance_generator.cache import cached_generate_instance
 from src.instance_generator.io import save_instance
 from src.run.main import run_two_stage
 
 # CSV helper you added
-from src.experiments.csv_export import write_csv
+from src.experiments.csv_export import CsvRowWriter
 
 
 # =============================================================================
@@ -45,6 +49,67 @@ def _fmt_vh(p21: float) -> str:
     return f"[{1.0 - p21:.1f}, {p21:.1f}]"
 
 
+# Console table line (template parsed once, bound .format)
+LINE_FMT = (
+    "{inst_id:<2d} {p_str:<28} {d:<2d} "
+    "[0.7, 0.3] {fixed_roles:<5d} {c_i:<3d} "
+    "{lik:<18} {mkp:<12} "
+    "{v_i:<10} {h_i:<10} "
+    "3    3    "
+    "{N_count:<3d} {I_count:<3d} "
+    "{skipN:<6d} {skipI:<6d} "
+    "{timeN:<6.0f} {timeI:<6.0f} "
+    "{g:<2d} {cpu:>8.0f}"
+).format
+
+
+# =============================================================================
+# Instance producer (runs in a background thread)
+# =============================================================================
+
+def _produce_instances(
+    ready: "queue.Queue[object]",
+    specs: List[Tuple[int, int, PaperKnobs]],
+    size,
+    tag: str,
+    cache_dir: Path | None,
+    instances_dir: Path | None,
+) -> None:
+    """
+    Puts (idx, par) for every spec into `ready`, in order.
+    Any exception is put into the queue instead, so run_table re-raises it.
+    """
+    try:
+        for inst_id, seed, cfg in specs:
+            # -------------------------
+            # Generate instance
+            # -------------------------
+            if cache_dir is not None:
+                idx, par = cached_generate_instance(size, cfg, seed=seed, cache_dir=cache_dir)
+            else:
+                idx, par = generate_instance(size, cfg, seed=seed)
+
+            # -------------------------
+            # Save generated instance (optional)
+            # -------------------------
+            if instances_dir is not None:
+                instances_dir.mkdir(parents=True, exist_ok=True)
+
+                # Make filename unique + informative
+                inst_name = (
+                    f"inst_{tag}_N{inst_id}_seed{seed}_"
+                    f"ni{size.n_i}_nj{size.n_j}_"
+                    f"roles{cfg.fixed_roles}_"
+                    f"plik{cfg.p_lik0}_pmkp{cfg.p_mkp0}_"
+                    f"pv{cfg.p_v_21}_ph{cfg.p_h_21}.npz"
+                )
+                save_instance(instances_dir / inst_name, idx, par)
+
+            ready.put((idx, par))
+    except BaseException as e:
+        ready.put(e)
+
+
 # =============================================================================
 # Table runner
 # =============================================================================
@@ -67,15 +132,18 @@ def run_table(
     # We pass it as a single budget (seconds).
     # ------------------------------------------------------------------
     budget_eps: float | None = None,
-) -> Tuple[List[str], List[Dict]]:
+    n_workers: int = 1,
+    csv_path: Path | None = None,
+    cache_dir: Path | None = None,
+) -> Path:
     """
-    Runs one of the paper tables (C.1 / C.2 / C.3) and returns:
-      - fieldnames: CSV column names
-      - rows: list of dict rows (paper columns)
+    Runs one of the paper tables (C.1 / C.2 / C.3) and returns the path of
+    the CSV written (default: data/results/<name>.csv).
 
     Notes:
     - We keep printing the same console lines as before.
-    - Additionally we store each row into `rows` for CSV export.
+    - Additionally each row is written to the CSV as soon as the instance
+      finishes (partial tables survive a crash mid-run).
     - Optionally we save every generated instance into a separate folder.
 
     Paper time-limit policy (Section 6.1.2):
@@ -127,176 +195,184 @@ def run_table(
         "CPU(seconds)",
     ]
 
-    rows: List[Dict] = []
-
-    # Paper layout: for each table, 32 instances:
-    # - first 16 rows fixed_roles=2
-    # - next 16 rows fixed_roles=1
-    # We achieve 16 per block by doing:
-    #   8 configurations * reps(=2) = 16
-    reps = 2
-
-    # Instance id ranges as in the paper
-    inst_id = 1 if size.n_i == 25 else (33 if size.n_i == 38 else 65)
-    seed = seeds_start
-
-    # Total number of Algorithm 5 iterations:
-    # steps_per_obj = steps, for objectives 2..7 => 6 dims
-    # v_i runs 0..steps inclusive => (steps+1) per dim
-    # total = (steps+1)^(n_z-1) = (steps+1)^6
-    n_z = 7
-    n_dims_eps = n_z - 1
-    #total_eps_iters = (steps + 1) ** n_dims_eps
-    total_eps_iters = (steps + 1) ** 2
-
-
-    # Block 0 => fixed_roles=2 configs, Block 1 => fixed_roles=1 configs
-    for block in range(2):
-        configs = GRID_FIXED2 if block == 0 else GRID_FIXED1
-
-        for cfg in configs:
-            for _ in range(reps):
-                # -------------------------
-                # Generate instance
-                # -------------------------
-                idx, par = generate_instance(size, cfg, seed=seed)
-
-                # -------------------------
-                # Save generated instance (optional)
-                # -------------------------
-                if save_instances:
-                    assert instances_dir is not None
-                    instances_dir.mkdir(parents=True, exist_ok=True)
-
-                    # Make filename unique + informative
-                    inst_name = (
-                        f"inst_{tag}_N{inst_id}_seed{seed}_"
-                        f"ni{size.n_i}_nj{size.n_j}_"
-                        f"roles{cfg.fixed_roles}_"
-                        f"plik{cfg.p_lik0}_pmkp{cfg.p_mkp0}_"
-                        f"pv{cfg.p_v_21}_ph{cfg.p_h_21}.json"
+    if csv_path is None:
+        csv_path = Path("data/results") / f"{name.lower().replace(' ', '_').replace('.', '')}.csv"
+    with CsvRowWriter(csv_path, fieldnames) as out:
+        # Paper layout: for each table, 32 instances:
+        # - first 16 rows fixed_roles=2
+        # - next 16 rows fixed_roles=1
+        # We achieve 16 per block by doing:
+        #   8 configurations * reps(=2) = 16
+        reps = 2
+
+        # Instance id ranges as in the paper
+        inst_id = 1 if size.n_i == 25 else (33 if size.n_i == 38 else 65)
+        seed = seeds_start
+
+        # Total number of Algorithm 5 iterations:
+        # steps_per_obj = steps, for objectives 2..7 => 6 dims
+        # v_i runs 0..steps inclusive => (steps+1) per dim
+        # total = (steps+1)^(n_z-1) = (steps+1)^6
+        n_z = 7
+        n_dims_eps = n_z - 1
+        #total_eps_iters = (steps + 1) ** n_dims_eps
+        total_eps_iters = (steps + 1) ** 2
+
+
+        # Instance order: block 0 => fixed_roles=2 configs, block 1 => fixed_roles=1
+        specs: List[Tuple[int, int, PaperKnobs]] = []
+        for block in range(2):
+            configs = GRID_FIXED2 if block == 0 else GRID_FIXED1
+            for cfg in configs:
+                for _ in range(reps):
+                    specs.append((inst_id, seed, cfg))
+                    inst_id += 1
+                    seed += 1
+
+        if save_instances:
+            assert instances_dir is not None
+
+        # Generate (+ save) the next instances in a background thread while the
+        # current one is being solved; at most 2 are prepared ahead.
+        ready: "queue.Queue[object]" = queue.Queue(maxsize=2)
+        producer = threading.Thread(
+            target=_produce_instances,
+            args=(ready, specs, size, tag, cache_dir, instances_dir if save_instances else None),
+            daemon=True,
+        )
+        producer.start()
+
+        for inst_id, seed, cfg in specs:
+            item = ready.get()
+            if isinstance(item, BaseException):
+                raise item
+            idx, par = item
+
+            # -------------------------
+            # Run full pipeline (Stage1 + Ideal/Nadir + Augmented eps)
+            # -------------------------
+            #
+            # IMPORTANT FIX (scalability robustness):
+            # Some instances may hit TimeLimit inside the IDEAL/NADIR phase
+            # with SolCount==0 (no feasible incumbent), which raises RuntimeError.
+            # In paper-style scalability tables, you do NOT crash; you record the row
+            # as "failed under time limits" and continue with the next instance.
+            #
+            # IMPORTANT (paper-faithful Algorithm 5):
+            # If budget_eps is provided, we do NOT pass a fixed tl_eps.
+            # Instead, we pass the total budget to run_two_stage, which will
+            # divide it per iteration (dynamic TimeLimit) inside Algorithm 5.
+            #
+            t0 = perf_counter()
+            try:
+                if budget_eps is None:
+                    # Old behavior: fixed per-iteration time limit for P^eps
+                    g_star, in_res, N, I, metrics = run_two_stage(
+                        idx,
+                        par,
+                        steps_per_obj=steps,
+                        time_limit_stage1=tl_stage1,
+                        time_limit_ideal=tl_ideal,
+                        time_limit_eps=tl_eps,
+                        n_workers=n_workers,
                     )
-                    save_instance(instances_dir / inst_name, idx, par)
-
-                # -------------------------
-                # Run full pipeline (Stage1 + Ideal/Nadir + Augmented eps)
-                # -------------------------
-                #
-                # IMPORTANT FIX (scalability robustness):
-                # Some instances may hit TimeLimit inside the IDEAL/NADIR phase
-                # with SolCount==0 (no feasible incumbent), which raises RuntimeError.
-                # In paper-style scalability tables, you do NOT crash; you record the row
-                # as "failed under time limits" and continue with the next instance.
-                #
-                # IMPORTANT (paper-faithful Algorithm 5):
-                # If budget_eps is provided, we do NOT pass a fixed tl_eps.
-                # Instead, we pass the total budget to run_two_stage, which will
-                # divide it per iteration (dynamic TimeLimit) inside Algorithm 5.
-                #
-                t0 = perf_counter()
-                try:
-                    if budget_eps is None:
-                        # Old behavior: fixed per-iteration time limit for P^eps
-                        g_star, in_res, N, I, metrics = run_two_stage(
-                            idx,
-                            par,
-                            steps_per_obj=steps,
-                            time_limit_stage1=tl_stage1,
-                            time_limit_ideal=tl_ideal,
-                            time_limit_eps=tl_eps,
-                        )
-                    else:
-                        # New behavior (paper-style): pass TOTAL budget for Algorithm 5.
-                        # Alg.5 will compute per-iteration TimeLimit dynamically from:
-                        #   remaining_budget / remaining_iterations
-                        # while also subtracting time used by previous steps and past iters.
-                        #
-                        # NOTE:
-                        # Your pipeline already supports this via `total_time_budget_eps`.
-                        # Do NOT pass custom kwargs like eps_budget_total/eps_total_iters.
-                        g_star, in_res, N, I, metrics = run_two_stage(
-                            idx,
-                            par,
-                            steps_per_obj=steps,
-                            time_limit_stage1=tl_stage1,
-                            time_limit_ideal=tl_ideal,
-                            total_time_budget_eps=budget_eps,
-                        )
-                    failed = False
-                except RuntimeError as e:
-                    # We keep going: record a "failed" row with sentinel values.
-                    # (This matches the idea of reporting TL/failed cases in scalability.)
-                    failed = True
-                    g_star = -1  # sentinel: could not complete stage2 pipeline
-                    metrics = type(
-                        "MetricsFallback",
-                        (),
-                        dict(N_count=0, I_count=0, skipN=0, skipI=0, timeN=0.0, timeI=0.0),
-                    )()
-                    # Optional: show the reason once, but do not stop the table
-                    print(f"WARNING: instance {inst_id} failed pipeline: {e}")
-
-                cpu = perf_counter() - t0
-
-                # -------------------------
-                # Format paper-style "Data" columns
-                # -------------------------
-                p_str = f"p({size.n_i}.{size.n_j}.{size.n_t}.{size.n_k}.{size.n_ell}.{size.n_p}.{size.n_q})"
-                c_i_val = int((size.n_i + 1) // 2)  # matches your print (13/19/25)
-
-                # -------------------------
-                # Console print (unchanged style)
-                # -------------------------
-                # If failed, counts/times are 0 and g=-1, CPU still printed.
-                line = (
-                    f"{inst_id:<2d} {p_str:<28} {size.d:<2d} "
-                    f"[0.7, 0.3] {cfg.fixed_roles:<5d} {c_i_val:<3d} "
-                    f"{_fmt_probs_lik(cfg.p_lik0):<18} {_fmt_probs_mkp(cfg.p_mkp0):<12} "
-                    f"{_fmt_vh(cfg.p_v_21):<10} {_fmt_vh(cfg.p_h_21):<10} "
-                    f"3    3    "
-                    f"{metrics.N_count:<3d} {metrics.I_count:<3d} "
-                    f"{metrics.skipN:<6d} {metrics.skipI:<6d} "
-                    f"{metrics.timeN:<6.0f} {metrics.timeI:<6.0f} "
-                    f"{g_star:<2d} {cpu:>8.0f}"
-                )
-                print(line)
-
-                # -------------------------
-                # CSV row (same info, structured)
-                # IMPORTANT:
-                # - time^N/time^I are durations; paper prints integers in tables,
-                #   so we round to int for CSV (you can keep float if you prefer).
-                # - CPU(seconds) rounded to int to mimic paper table look.
-                # -------------------------
-                row = {
-                    "N": inst_id,
-                    "p(n_i.n_j.n_t.n_k.n_ell.n_p.n_q)": p_str,
-                    "d": size.d,
-                    "u_i": "[0.7, 0.3]",
-                    "e_ijt": cfg.fixed_roles,
-                    "c_i": c_i_val,
-                    "lik": _fmt_probs_lik(cfg.p_lik0),
-                    "mkp": _fmt_probs_mkp(cfg.p_mkp0),
-                    "v_i": _fmt_vh(cfg.p_v_21),
-                    "h_i": _fmt_vh(cfg.p_h_21),
-                    "r_iq": 3,
-                    "t_iq": 3,
-                    "|N|": int(metrics.N_count),
-                    "|I|": int(metrics.I_count),
-                    "skip^N": int(metrics.skipN),
-                    "skip^I": int(metrics.skipI),
-                    "time^N": int(round(float(metrics.timeN))),
-                    "time^I": int(round(float(metrics.timeI))),
-                    "g": int(g_star),
-                    "CPU(seconds)": int(round(cpu)),
-                }
-                rows.append(row)
-
-                # next instance
-                inst_id += 1
-                seed += 1
-
-    return fieldnames, rows
+                else:
+                    # New behavior (paper-style): pass TOTAL budget for Algorithm 5.
+                    # Alg.5 will compute per-iteration TimeLimit dynamically from:
+                    #   remaining_budget / remaining_iterations
+                    # while also subtracting time used by previous steps and past iters.
+                    #
+                    # NOTE:
+                    # Your pipeline already supports this via `total_time_budget_eps`.
+                    # Do NOT pass custom kwargs like eps_budget_total/eps_total_iters.
+                    g_star, in_res, N, I, metrics = run_two_stage(
+                        idx,
+                        par,
+                        steps_per_obj=steps,
+                        time_limit_stage1=tl_stage1,
+                        time_limit_ideal=tl_ideal,
+                        total_time_budget_eps=budget_eps,
+                        n_workers=n_workers,
+                    )
+                failed = False
+            except RuntimeError as e:
+                # We keep going: record a "failed" row with sentinel values.
+                # (This matches the idea of reporting TL/failed cases in scalability.)
+                failed = True
+                g_star = -1  # sentinel: could not complete stage2 pipeline
+                metrics = type(
+                    "MetricsFallback",
+                    (),
+                    dict(N_count=0, I_count=0, skipN=0, skipI=0, timeN=0.0, timeI=0.0),
+                )()
+                # Optional: show the reason once, but do not stop the table
+                print(f"WARNING: instance {inst_id} failed pipeline: {e}")
+
+            cpu = perf_counter() - t0
+
+            # -------------------------
+            # Format paper-style "Data" columns
+            # -------------------------
+            p_str = f"p({size.n_i}.{size.n_j}.{size.n_t}.{size.n_k}.{size.n_ell}.{size.n_p}.{size.n_q})"
+            c_i_val = int((size.n_i + 1) // 2)  # matches your print (13/19/25)
+
+            # -------------------------
+            # Console print (unchanged style)
+            # -------------------------
+            # If failed, counts/times are 0 and g=-1, CPU still printed.
+            line = LINE_FMT(
+                inst_id=inst_id,
+                p_str=p_str,
+                d=size.d,
+                fixed_roles=cfg.fixed_roles,
+                c_i=c_i_val,
+                lik=_fmt_probs_lik(cfg.p_lik0),
+                mkp=_fmt_probs_mkp(cfg.p_mkp0),
+                v_i=_fmt_vh(cfg.p_v_21),
+                h_i=_fmt_vh(cfg.p_h_21),
+                N_count=metrics.N_count,
+                I_count=metrics.I_count,
+                skipN=metrics.skipN,
+                skipI=metrics.skipI,
+                timeN=metrics.timeN,
+                timeI=metrics.timeI,
+                g=g_star,
+                cpu=cpu,
+            )
+            print(line)
+
+            # -------------------------
+            # CSV row (same info, structured)
+            # IMPORTANT:
+            # - time^N/time^I are durations; paper prints integers in tables,
+            #   so we round to int for CSV (you can keep float if you prefer).
+            # - CPU(seconds) rounded to int to mimic paper table look.
+            # -------------------------
+            row = {
+                "N": inst_id,
+                "p(n_i.n_j.n_t.n_k.n_ell.n_p.n_q)": p_str,
+                "d": size.d,
+                "u_i": "[0.7, 0.3]",
+                "e_ijt": cfg.fixed_roles,
+                "c_i": c_i_val,
+                "lik": _fmt_probs_lik(cfg.p_lik0),
+                "mkp": _fmt_probs_mkp(cfg.p_mkp0),
+                "v_i": _fmt_vh(cfg.p_v_21),
+                "h_i": _fmt_vh(cfg.p_h_21),
+                "r_iq": 3,
+                "t_iq": 3,
+                "|N|": int(metrics.N_count),
+                "|I|": int(metrics.I_count),
+                "skip^N": int(metrics.skipN),
+                "skip^I": int(metrics.skipI),
+                "time^N": int(round(float(metrics.timeN))),
+                "time^I": int(round(float(metrics.timeI))),
+                "g": int(g_star),
+                "CPU(seconds)": int(round(cpu)),
+            }
+            out.writerow(row)
+
+    return csv_path
 
 
 # =============================================================================
@@ -324,6 +400,9 @@ def main():
 
     ap.add_argument("--seed_start", type=int, default=1)
 
+    # Algorithms 1 and 5: number of worker processes for the subproblem solves (1 = serial)
+    ap.add_argument("--workers", type=int, default=1)
+
     # NEW: output folder for CSVs
     ap.add_argument("--out_dir", type=str, default="data/results")
 
@@ -333,12 +412,17 @@ def main():
     ap.add_argument("--save_instances", action="store_true")
     ap.add_argument("--instances_dir", type=str, default="data/generated/instances_scalability")
 
+    # Reuse generated instances across runs (keyed by size/knobs/seed/generator version)
+    ap.add_argument("--instance_cache", action="store_true")
+    ap.add_argument("--cache_dir", type=str, default="data/cache/instances")
+
     args = ap.parse_args()
 
     out_dir = Path(args.out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
     instances_dir = Path(args.instances_dir)
+    cache_dir = Path(args.cache_dir) if args.instance_cache else None
 
     # ------------------------------------------------------------------
     # Alias behavior:
@@ -353,7 +437,7 @@ def main():
         tl_eps = args.tl_eps  # unused in paper-budget mode
 
     # # Table C.1 (small)
-    # f1, rows1 = run_table(
+    # run_table(
     #     "Table C.1",
     #     SMALL,
     #     args.seed_start,
@@ -365,11 +449,13 @@ def main():
     #     instances_dir=instances_dir,
     #     tag="C1",
     #     budget_eps=budget_eps,
+    #     n_workers=args.workers,
+    #     csv_path=out_dir / "table_C1.csv",
+    #     cache_dir=cache_dir,
     # )
-    # write_csv(out_dir / "table_C1.csv", f1, rows1)
 
     # # Table C.2 (medium)
-    # f2, rows2 = run_table(
+    # run_table(
     #     "Table C.2",
     #     MED,
     #     args.seed_start + 1000,
@@ -381,11 +467,13 @@ def main():
     #     instances_dir=instances_dir,
     #     tag="C2",
     #     budget_eps=budget_eps,
+    #     n_workers=args.workers,
+    #     csv_path=out_dir / "table_C2.csv",
+    #     cache_dir=cache_dir,
     # )
-    # write_csv(out_dir / "table_C2.csv", f2, rows2)
     #
     # Table C.3 (large)
-    f3, rows3 = run_table(
+    run_table(
         "Table C.3",
         LARGE,
         args.seed_start + 2000,
@@ -397,8 +485,10 @@ def main():
         instances_dir=instances_dir,
         tag="C3",
         budget_eps=budget_eps,
+        n_workers=args.workers,
+        csv_path=out_dir / "table_C3.csv",
+        cache_dir=cache_dir,
     )
-    write_csv(out_dir / "table_C3.csv", f3, rows3)
 
     print(f"\nCSV written to: {out_dir.resolve()}")
     print(" - table_C1.csv")
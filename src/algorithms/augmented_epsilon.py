@@ -4,13 +4,19 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Tuple, Sequence, Dict, Optional
 
+import math
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
 from time import perf_counter
 from pathlib import Path
-from gurobipy import GRB
 
+import numpy as np
+from gurobipy import GRB, LinExpr
+
+from src.common.dominance import dominates_batch, dominated_by_batch
 from src.common.solve_tracker import SolveTracker
-from src.model.build import build_stage2_base
-from src.model.zexpr import build_z_defs
+from src.model.build import BuiltModel, build_stage2_base
+from src.model.zexpr import compile_z_evaluator
 from src.experiments.schedule_export import extract_schedule_rows
 
 
@@ -20,13 +26,74 @@ from src.experiments.schedule_export import extract_schedule_rows
 
 @dataclass
 class SolutionPoint:
-    z: List[float]                 # full objective vector in maximize-form (z1..z_n)
-    eps: List[float]               # eps used (bounded objectives order)
-    z_bounded: List[float]         # achieved bounded objectives (same order as eps)
+    # float64 arrays: objective values are compared exactly against eps grid values
+    z: np.ndarray                  # full objective vector in maximize-form (z1..z_n)
+    eps: np.ndarray                # eps used (bounded objectives order)
+    z_bounded: np.ndarray          # achieved bounded objectives (same order as eps)
     status: int                    # GRB status code
-    proven: bool                   # True if OPTIMAL; False if TIME_LIMIT incumbent accepted
+    proven: bool                   # True if OPTIMAL at default MIPGap; False for TIME_LIMIT incumbents or budget fast regime
     schedule: list[dict] | None = None   # NEW: extracted schedule rows
 
+    def __eq__(self, other: object) -> bool:
+        # field-wise like the generated __eq__, but arrays compare as a whole
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            np.array_equal(self.z, other.z)
+            and np.array_equal(self.eps, other.eps)
+            and np.array_equal(self.z_bounded, other.z_bounded)
+            and self.status == other.status
+            and self.proven == other.proven
+            and self.schedule == other.schedule
+        )
+
+@dataclass
+class PointArchive:
+    """
+    Contiguous (rows x d) float64 store for the z_bounded vectors of N.
+
+    Rows live in one preallocated buffer that grows by amortized doubling, so the
+    dominance tests of add_to_N_keep_nondominated are single vectorized NumPy
+    passes over `rows` instead of Python loops over lists of lists.
+    """
+    d: int
+    capacity: int = 16
+
+    def __post_init__(self) -> None:
+        self._buf = np.empty((max(self.capacity, 1), self.d), dtype=np.float64)
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._buf[: self._n]
+
+    def append(self, vec: np.ndarray) -> None:
+        if self._n == self._buf.shape[0]:
+            grown = np.empty((2 * self._buf.shape[0], self.d), dtype=np.float64)
+            grown[: self._n] = self._buf[: self._n]
+            self._buf = grown
+        self._buf[self._n] = vec
+        self._n += 1
+
+    def keep(self, mask: np.ndarray) -> None:
+        kept = self.rows[mask]
+        self._n = kept.shape[0]
+        self._buf[: self._n] = kept
+
+
+@dataclass(frozen=True)
+class EpsSolveResult:
+    """Outcome of one P^eps solve (picklable, returned by pool workers)."""
+    status: int                          # GRB status code
+    dt: float                            # wall time of optimize()
+    proven: bool = False                 # OPTIMAL at the default MIPGap
+    z: Optional[List[float]] = None      # set only if a usable solution exists
+    schedule: list[dict] | None = None
+
+
 @dataclass(frozen=True)
 class AugEpsMetrics:
     N_count: int
@@ -41,94 +108,327 @@ class AugEpsMetrics:
 # Helpers
 # =============================================================================
 
-def update_v(v: List[int], steps: List[int]) -> Tuple[List[int], bool]:
+def decode_v(k: int, radix: Sequence[int]) -> Tuple[int, ...]:
     """
-    Paper Algorithm 2 style counter.
-    Increments the first component that can still increase, then resets lower-order ones.
+    Paper Algorithm 2 style counter, as a mixed-radix integer.
+    Component 0 varies fastest, i.e. the same order the incrementing counter
+    (increment first non-saturated component, reset lower-order ones) visits.
     """
-    v = v[:]
-    if all(v[i] == steps[i] for i in range(len(v))):
-        return v, True
-    i_star = next(i for i in range(len(v)) if v[i] < steps[i])
-    v[i_star] += 1
-    for i in range(i_star):
-        v[i] = 0
-    return v, False
+    v = []
+    for r in radix:
+        k, digit = divmod(k, r)
+        v.append(digit)
+    return tuple(v)
 
 
-def compute_eps_for_bounded(
+def build_eps_grid(
     z_nad: List[float],
     z_star: List[float],
-    v: List[int],
     steps: List[int],
     bounded_objectives: Sequence[int],
-) -> List[float]:
+) -> np.ndarray:
     """
     Paper Eq.(44): epsilon grid for bounded objectives only.
-    Guard steps==0 to avoid division by zero.
+
+    All inputs are loop-invariant, so the whole grid is materialized once:
+        eps_grid[v_1, ..., v_d] = eps vector for counter v  (shape (steps+1)^d x d)
+    Guard steps==0 to avoid division by zero (single point at the nadir).
     """
-    eps: List[float] = []
+    axes: List[np.ndarray] = []
     for local, obj_id in enumerate(bounded_objectives):
+        nad = float(z_nad[obj_id - 1])
         if steps[local] <= 0:
-            eps_i = z_nad[obj_id - 1]
+            axes.append(np.array([nad], dtype=np.float64))
         else:
             p = 1.0 / steps[local]
-            eps_i = z_nad[obj_id - 1] + v[local] * p * (z_star[obj_id - 1] - z_nad[obj_id - 1])
-        eps.append(float(eps_i))
-    return eps
+            axes.append(nad + np.arange(steps[local] + 1) * p * (float(z_star[obj_id - 1]) - nad))
+    if not axes:
+        return np.empty((0,), dtype=np.float64)
+    return np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1)
 
 
-def vec_dominates(a: List[float], b: List[float]) -> bool:
+def flatten_eps_grid(eps_grid: np.ndarray) -> np.ndarray:
     """
-    Dominance for '>= all and > at least one' (maximize form).
+    eps_grid as a (total_iters x d) array in iteration order:
+    row k is the eps vector of v = decode_v(k, radix) (component 0 fastest).
     """
-    if len(a) != len(b):
-        raise ValueError("dominance vectors must have same length")
-    ge_all = True
-    gt_any = False
-    for i in range(len(a)):
-        if a[i] < b[i]:
-            ge_all = False
-            break
-        if a[i] > b[i]:
-            gt_any = True
-    return ge_all and gt_any
-
-
-def add_to_N_keep_nondominated(N: List[SolutionPoint], cand: SolutionPoint) -> None:
+    if eps_grid.ndim == 1:
+        return eps_grid.reshape(1, -1)
+    d = eps_grid.shape[-1]
+    reversed_axes = tuple(range(d - 1, -1, -1)) + (d,)
+    return np.ascontiguousarray(eps_grid.transpose(reversed_axes)).reshape(-1, d)
+
+
+def add_to_N_keep_nondominated(N: List[SolutionPoint], N_arr: PointArchive, cand: SolutionPoint) -> None:
     """
     Keep N as a NON-DOMINATED set w.r.t. z_bounded (the bounded objectives).
-    This makes skip_solutions() correct.
+
+    N_arr mirrors N row-by-row (same order) and is what the dominance tests run on.
     """
+    z = cand.z_bounded
+
     # If some existing solution dominates candidate -> drop candidate
-    for sol in N:
-        if vec_dominates(sol.z_bounded, cand.z_bounded):
-            return
+    if dominates_batch(N_arr.rows, z).any():
+        return
 
     # Otherwise remove solutions dominated by candidate
-    N[:] = [sol for sol in N if not vec_dominates(cand.z_bounded, sol.z_bounded)]
+    keep = ~dominated_by_batch(N_arr.rows, z)
+    if not keep.all():
+        N[:] = [sol for sol, k in zip(N, keep) if k]
+        N_arr.keep(keep)
+
     N.append(cand)
+    N_arr.append(z)
+
+
+class GridCover:
+    """
+    Grid-index form of the two skip tests: one flag per eps grid cell.
 
+    Every eps axis is non-decreasing (z_star >= z_nad), so for a point z:
+        z_bounded >= eps[v]  <=>  v <= c(z),  c_k = #{axis_k <= z_k} - 1
+    so a point entering N marks the box [0..c] as skip^N, and a proven
+    infeasible eps marks the box of cells with eps[v] >= it as skip^I. Both
+    tests then become one array lookup per v, without touching the eps
+    vector. Boundary cells (some v_k == 0, eps_k at the nadir) are covered
+    by almost every point.
 
-def skip_solutions(N: List[SolutionPoint], eps: List[float]) -> bool:
+    The flags are stored with the axes reversed, so their C-order ravel is in
+    iteration order: flag k belongs to v = decode_v(k, radix).
+
+    Marks never need undoing: a point dropped from N is dominated by the
+    point that replaced it, whose box contains its box.
+    """
+
+    def __init__(self, eps_grid: np.ndarray):
+        d = eps_grid.shape[-1]
+        self.axes = [
+            eps_grid[(0,) * k + (slice(None),) + (0,) * (d - k - 1) + (k,)]
+            for k in range(d)
+        ]
+        shape = eps_grid.shape[:-1][::-1]
+        self.covered_N = np.zeros(shape, dtype=bool)
+        self.covered_I = np.zeros(shape, dtype=bool)
+        # flat views indexed by the iteration counter k
+        self.covered_N_flat = self.covered_N.reshape(-1)
+        self.covered_I_flat = self.covered_I.reshape(-1)
+
+    def mark_point(self, z_bounded: Sequence[float]) -> None:
+        box = []
+        for axis, z_k in zip(self.axes, z_bounded):
+            c_k = int(np.searchsorted(axis, z_k, side="right")) - 1
+            if c_k < 0:
+                return
+            box.append(slice(0, c_k + 1))
+        self.covered_N[tuple(box[::-1])] = True
+
+    def mark_infeasible(self, eps: Sequence[float]) -> None:
+        # first index per axis with axis_k >= eps_k (ties matter when z_star == z_nad)
+        box = [
+            slice(int(np.searchsorted(axis, e_k, side="left")), None)
+            for axis, e_k in zip(self.axes, eps)
+        ]
+        self.covered_I[tuple(box[::-1])] = True
+
+
+def skip_solutions(grid: GridCover, k: int) -> bool:
     """
-    Skip eps if an existing NON-DOMINATED solution already satisfies eps constraints:
-        z_bounded >= eps component-wise
+    Skip eps of iteration k if an existing NON-DOMINATED solution already
+    satisfies its eps constraints (z_bounded >= eps component-wise).
     """
-    for sol in N:
-        if all(sol.z_bounded[i] >= eps[i] for i in range(len(eps))):
-            return True
-    return False
+    return bool(grid.covered_N_flat[k])
 
 
-def skip_infeasible(I: List[List[float]], eps: List[float]) -> bool:
+def skip_infeasible(grid: GridCover, k: int) -> bool:
     """
-    If eps is harder (>=) than an already-proven infeasible epsbar, then skip.
+    Skip eps of iteration k if it is harder (>=) than an already-proven
+    infeasible epsbar.
     """
-    for epsbar in I:
-        if all(eps[i] >= epsbar[i] for i in range(len(eps))):
-            return True
-    return False
+    return bool(grid.covered_I_flat[k])
+
+
+# =============================================================================
+# P^eps subproblem (built once, reused for every eps)
+# =============================================================================
+
+# seconds; smaller changes of the per-solve TimeLimit are not written to the model
+TIME_LIMIT_TOL = 1.0
+
+# Budget mode: per-solve TimeLimit thresholds (seconds) for switching MIP settings.
+# Below FAST_REGIME_BELOW the solver targets a good incumbent (FAST_PARAMS);
+# above DEFAULT_REGIME_ABOVE it goes back to DEFAULT_PARAMS. In between the
+# current regime is kept, so the settings do not flip on every solve.
+FAST_REGIME_BELOW = 30.0
+DEFAULT_REGIME_ABOVE = 300.0
+FAST_PARAMS = {"MIPGap": 0.02, "Heuristics": 0.5, "Cuts": 1, "Presolve": 1}
+DEFAULT_PARAMS = {"MIPGap": 1e-4, "Heuristics": 0.05, "Cuts": -1, "Presolve": -1}
+
+class EpsSubproblem:
+    """
+    P^eps of paper Eq.(42) with Fix A applied:
+      - model, ε-constraints and surplus variables are created ONCE
+      - solve() only moves the ε right-hand sides and re-optimizes
+
+    Used directly in serial mode, and once per process in parallel mode
+    (see _init_worker), so every worker keeps its own warm model.
+
+    `base` may be an existing Stage-2 model with the same g (e.g. the one
+    Alg.1 used); the ε-constraints and surplus variables are added to it.
+    names=True (set for debug_iis) needs a named model, so an unnamed `base`
+    is not reused then.
+    """
+
+    def __init__(
+        self,
+        idx, par, g_value: int,
+        z_star: List[float], z_nad: List[float],
+        *,
+        n_z: int,
+        bounded_objectives: Sequence[int],
+        fully_considered_objective: int,
+        base: Optional[BuiltModel] = None,
+        names: bool = False,
+    ):
+        self.idx = idx
+        self.bounded_objectives = list(bounded_objectives)
+
+        if base is not None and (base.names or not names):
+            bm = base
+        else:
+            bm = build_stage2_base(idx, par, g_value, name="P_eps", names=names)
+        z_defs = bm.ensure_z_defs(idx, par)
+
+        # ε-constraints (create once; store handles)
+        eps_constrs = []
+        for local, obj_id in enumerate(self.bounded_objectives):
+            c = bm.m.addConstr(
+                z_defs[obj_id].expr >= float(z_nad[obj_id - 1]),
+                name=f"eps_obj{obj_id}",
+            )
+            eps_constrs.append(c)
+
+        # surplus vars Eq.(41) (create once; does not depend on eps value)
+        s_vars: Dict[int, object] = {}
+        for obj_id in self.bounded_objectives:
+            denom = (z_star[obj_id - 1] - z_nad[obj_id - 1])
+            if abs(denom) < 1e-9:
+                s_vars[obj_id] = bm.m.addVar(lb=0.0, ub=0.0, vtype=GRB.CONTINUOUS, name=f"surplus_{obj_id}")
+            else:
+                s_vars[obj_id] = bm.m.addVar(lb=0.0, ub=1.0, vtype=GRB.CONTINUOUS, name=f"surplus_{obj_id}")
+                bm.m.addConstr(
+                    z_defs[obj_id].expr - z_nad[obj_id - 1] == denom * s_vars[obj_id],
+                    name=f"surplus_def_{obj_id}",
+                )
+
+        # Eq.(42): maximize z_fully + (n_z - 0.9)^(-1) * sum surplus
+        coef = 1.0 / (n_z - 0.9)
+        phi = LinExpr(
+            [coef] * len(self.bounded_objectives),
+            [s_vars[obj_id] for obj_id in self.bounded_objectives],
+        )
+        bm.m.setObjective(z_defs[fully_considered_objective].expr + phi, GRB.MAXIMIZE)
+
+        # no limit unless a mode asks for one (TimeLimit=0 would mean 0 seconds)
+        bm.m.setParam("TimeLimit", GRB.INFINITY)
+        bm.m.update()
+
+        self.bm = bm
+        self.eps_constrs = eps_constrs
+        # MIP start carried from solve to solve (adjacent eps differ only in RHS)
+        self._vars = bm.m.getVars()
+        self._start: Optional[List[float]] = None
+        self._time_limit = GRB.INFINITY
+        self._fast = False
+        # post-solve evaluation of z_1..z_n from one batched X read
+        self.z_eval = compile_z_evaluator(bm.m, z_defs, n_z)
+
+    def solve(
+        self,
+        v: Tuple[int, ...],
+        eps: List[float],
+        time_limit: Optional[float],
+        *,
+        accept_time_limit_incumbent: bool = False,
+        debug_iis: bool = False,
+        iis_dir: str = "data/debug/iis",
+        adaptive_params: bool = False,
+    ) -> EpsSolveResult:
+        m = self.bm.m
+
+        # Fix A core: update RHS only + optimize() (which syncs pending changes itself)
+        for local, c in enumerate(self.eps_constrs):
+            c.RHS = float(eps[local])
+
+        # only write TimeLimit when it moves by more than TIME_LIMIT_TOL seconds
+        tl = GRB.INFINITY if time_limit is None else float(time_limit)
+        if abs(tl - self._time_limit) > TIME_LIMIT_TOL:
+            m.setParam("TimeLimit", tl)
+            self._time_limit = tl
+
+        # budget mode: switch MIP settings only on regime transitions
+        if adaptive_params:
+            if not self._fast and tl < FAST_REGIME_BELOW:
+                self._fast = True
+                for name, val in FAST_PARAMS.items():
+                    m.setParam(name, val)
+            elif self._fast and tl > DEFAULT_REGIME_ABOVE:
+                self._fast = False
+                for name, val in DEFAULT_PARAMS.items():
+                    m.setParam(name, val)
+
+        # no reset(): keep basis / incumbent, and seed the last solution explicitly
+        if self._start is not None:
+            m.setAttr("Start", self._vars, self._start)
+
+        t0 = perf_counter()
+        m.optimize()
+        dt = perf_counter() - t0
+
+        st = m.Status
+        if m.SolCount > 0:
+            self._start = m.getAttr("X", self._vars)
+
+        if st == GRB.INFEASIBLE:
+            if debug_iis:
+                try:
+                    iis_path = Path(iis_dir)
+                    iis_path.mkdir(parents=True, exist_ok=True)
+                    m.computeIIS()
+                    fname = f"iis_v_{'_'.join(map(str, v))}.ilp"
+                    m.write(str(iis_path / fname))
+                except Exception as ex:
+                    print(f"[debug_iis] IIS export failed: {ex}")
+            return EpsSolveResult(status=st, dt=dt)
+
+        # TIME_LIMIT != infeasible: only an accepted incumbent is usable
+        if st == GRB.OPTIMAL or (
+            st == GRB.TIME_LIMIT and accept_time_limit_incumbent and m.SolCount > 0
+        ):
+            return EpsSolveResult(
+                status=st,
+                dt=dt,
+                # with FAST_PARAMS, OPTIMAL only means within a 2% gap
+                proven=(st == GRB.OPTIMAL and not self._fast),
+                z=self.z_eval.values(m),
+                schedule=extract_schedule_rows(self.idx, self.bm.var),
+            )
+
+        # unknown -> nothing usable
+        return EpsSolveResult(status=st, dt=dt)
+
+
+# per-process subproblem for the parallel mode
+_WORKER: Optional[EpsSubproblem] = None
+
+
+def _init_worker(args: tuple, kwargs: dict) -> None:
+    global _WORKER
+    _WORKER = EpsSubproblem(*args, **kwargs)
+
+
+def _solve_in_worker(v: Tuple[int, ...], eps: List[float], time_limit: Optional[float], opts: dict) -> EpsSolveResult:
+    assert _WORKER is not None
+    return _WORKER.solve(v, eps, time_limit, **opts)
 
 
 # =============================================================================
@@ -156,6 +456,12 @@ def solve_augmented_epsilon(
     accept_time_limit_incumbent: bool = False,
     debug_iis: bool = False,
     iis_dir: str = "data/debug/iis",
+
+    # Parallel mode: number of worker processes (1 = serial, paper behaviour)
+    n_workers: int = 1,
+
+    # Optional Stage-2 model to extend (serial mode); owned by the caller
+    base: Optional[BuiltModel] = None,
 ):
     """
     Augmented ε-constraint method (paper Algorithm 5).
@@ -163,12 +469,28 @@ def solve_augmented_epsilon(
     ✅ Fix A (screenshot):
       - Build P_eps ONCE outside the loop
       - Add ε-constraints ONCE (store them)
-      - Each iteration: update constr.RHS = eps_value + update() + optimize()
+      - Each iteration: update constr.RHS = eps_value + optimize()
 
     Also included because you reuse the model:
-      - bm.m.reset() before each optimize
+      - no reset() between solves; the previous incumbent is passed as MIP start
       - keep N non-dominated so skip_solutions is safe
       - TIME_LIMIT without incumbent is NOT infeasible -> do not add to I
+
+    Parallel mode (n_workers > 1):
+      - each worker process builds its own P_eps once (Fix A per worker, Threads=1)
+      - the grid is walked in rounds: the next n_workers eps that survive the
+        skip tests are solved concurrently, then merged into N / I in grid order
+        with the skip tests repeated at merge time, so the serial skip rule
+        is applied to every eps (surplus solves are wasted)
+      - in budget mode the remaining budget is divided by the remaining number
+        of ROUNDS, i.e. ceil(remaining_iters / n_workers)
+
+    The skip tests are per-cell grid flags (GridCover), and the loop stops as
+    soon as every remaining cell is already skip^N / skip^I; the skip counters
+    still include those cells.
+
+    Budget mode also loosens the MIP settings (FAST_PARAMS) while the
+    per-solve TimeLimit is short; solutions found that way have proven=False.
     """
 
     if tracker is None:
@@ -190,165 +512,167 @@ def solve_augmented_epsilon(
         if obj_id == fully_considered_objective:
             raise ValueError("fully_considered objective cannot be bounded too")
 
+    if n_workers < 1:
+        raise ValueError("n_workers must be >= 1")
+
+    # Alg.1 takes z_nad as a column minimum over rows including z_star's, and
+    # GridCover relies on the resulting non-decreasing eps axes
+    if any(z_star[obj_id - 1] < z_nad[obj_id - 1] for obj_id in bounded_objectives):
+        raise ValueError("z_star must be >= z_nad for every bounded objective")
+
     # if total budget exists, ignore fixed per-iter tl
     if total_time_budget is not None:
         time_limit_per_iter = None
 
-    v = [0] * len(bounded_objectives)
-    stop = False
-
     N: List[SolutionPoint] = []
     I: List[List[float]] = []   # proven infeasible eps vectors only
 
+    # array mirror of N (z_bounded rows) for the dominance tests
+    bounded_cols = np.array([obj_id - 1 for obj_id in bounded_objectives], dtype=np.intp)
+    N_arr = PointArchive(len(bounded_objectives))
+
     skipN = 0
     skipI = 0
     timeN = 0.0
     timeI = 0.0
 
-    iis_path = Path(iis_dir)
     alg5_start = perf_counter()
 
     # total epsilon iterations = product (steps[d]+1)
+    radix = [max(s, 0) + 1 for s in steps]
     total_iters = 1
-    for s in steps:
-        total_iters *= (max(s, 0) + 1)
+    for r in radix:
+        total_iters *= r
 
-    iter_idx = 0
+    eps_grid = build_eps_grid(z_nad, z_star, steps, bounded_objectives)
+    eps_flat = flatten_eps_grid(eps_grid)
+    # O(1) skip flags per grid cell
+    grid = GridCover(eps_grid)
 
     # ======================================================================
     # FIX A: build model once, add ε-constraints once, reuse
     # ======================================================================
-    bm = build_stage2_base(idx, par, g_value, name="P_eps")
-    z_defs = build_z_defs(idx, par, bm.var)
-
-    # ε-constraints (create once; store handles)
-    eps_constrs = []
-    for local, obj_id in enumerate(bounded_objectives):
-        c = bm.m.addConstr(
-            z_defs[obj_id].expr >= float(z_nad[obj_id - 1]),
-            name=f"eps_obj{obj_id}",
+    sub_args = (idx, par, g_value, z_star, z_nad)
+    sub_kwargs = dict(
+        n_z=n_z,
+        bounded_objectives=bounded_objectives,
+        fully_considered_objective=fully_considered_objective,
+        # readable IIS files need named variables and rows
+        names=debug_iis,
+    )
+    solve_opts = dict(
+        accept_time_limit_incumbent=accept_time_limit_incumbent,
+        debug_iis=debug_iis,
+        iis_dir=iis_dir,
+        adaptive_params=total_time_budget is not None,
+    )
+
+    pool: Optional[ProcessPoolExecutor] = None
+    sub: Optional[EpsSubproblem] = None
+    if n_workers > 1:
+        # spawn: never fork a process that already holds a Gurobi env
+        pool = ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(sub_args, sub_kwargs),
         )
-        eps_constrs.append(c)
-
-    # surplus vars Eq.(41) (create once; does not depend on eps value)
-    s_vars: Dict[int, object] = {}
-    for obj_id in bounded_objectives:
-        denom = (z_star[obj_id - 1] - z_nad[obj_id - 1])
-        if abs(denom) < 1e-9:
-            s_vars[obj_id] = bm.m.addVar(lb=0.0, ub=0.0, vtype=GRB.CONTINUOUS, name=f"surplus_{obj_id}")
-        else:
-            s_vars[obj_id] = bm.m.addVar(lb=0.0, ub=1.0, vtype=GRB.CONTINUOUS, name=f"surplus_{obj_id}")
-            bm.m.addConstr(
-                z_defs[obj_id].expr - z_nad[obj_id - 1] == denom * s_vars[obj_id],
-                name=f"surplus_def_{obj_id}",
-            )
-
-    # Eq.(42): maximize z_fully + (n_z - 0.9)^(-1) * sum surplus
-    phi = (1.0 / (n_z - 0.9)) * sum(s_vars[obj_id] for obj_id in bounded_objectives)
-    bm.m.setObjective(z_defs[fully_considered_objective].expr + phi, GRB.MAXIMIZE)
-
-    bm.m.update()
+    else:
+        sub = EpsSubproblem(*sub_args, **sub_kwargs, base=base)
 
     # ======================================================================
-    # Main enumeration loop
+    # Main enumeration loop (rounds of up to n_workers solves)
     # ======================================================================
-    while not stop:
-        iter_idx += 1
-        eps = compute_eps_for_bounded(z_nad, z_star, v, steps, bounded_objectives)
-
-        if skip_solutions(N, eps):
-            skipN += 1
-
-        elif skip_infeasible(I, eps):
-            skipI += 1
+    try:
+        k = 0
+        while k < total_iters:
+            batch: List[Tuple[int, Tuple[int, ...], np.ndarray]] = []
+            while k < total_iters and len(batch) < n_workers:
+                if skip_solutions(grid, k):
+                    skipN += 1
+                elif skip_infeasible(grid, k):
+                    skipI += 1
+                else:
+                    # v is only needed for labels / IIS file names
+                    batch.append((k, decode_v(k, radix), eps_flat[k]))
+                k += 1
 
-        else:
-            # --------------------------------------------------------------
-            # Fix A core: update RHS only + update() + optimize()
-            # --------------------------------------------------------------
-            for local, c in enumerate(eps_constrs):
-                c.RHS = float(eps[local])
-            bm.m.update()
+            if not batch:
+                continue
 
             # time limits
             if total_time_budget is not None:
                 elapsed = perf_counter() - alg5_start
                 remaining = max(0.0, float(total_time_budget) - elapsed)
-                remaining_iters = max(1, total_iters - (iter_idx - 1))
-                bm.m.Params.TimeLimit = float(remaining / remaining_iters)
-            elif time_limit_per_iter is not None:
-                bm.m.Params.TimeLimit = float(time_limit_per_iter)
+                remaining_iters = max(1, total_iters - batch[0][0])
+                tl = float(remaining / math.ceil(remaining_iters / n_workers))
             else:
-                bm.m.Params.TimeLimit = 0.0
-
-            tracker.tick(f"STAGE 2 / Alg.5: P^eps solve v={v} eps={eps}")
-
-            t0 = perf_counter()
-            bm.m.reset()
-            bm.m.optimize()
-            dt = perf_counter() - t0
-
-            st = bm.m.Status
-
-            if st == GRB.INFEASIBLE:
-                I.append(eps)
-                timeI += dt
-
-                if debug_iis:
-                    try:
-                        iis_path.mkdir(parents=True, exist_ok=True)
-                        bm.m.computeIIS()
-                        fname = f"iis_v_{'_'.join(map(str, v))}.ilp"
-                        bm.m.write(str(iis_path / fname))
-                    except Exception as ex:
-                        print(f"[debug_iis] IIS export failed: {ex}")
-
-            elif st == GRB.OPTIMAL:
-                z_vec = [float(z_defs[i_obj].expr.getValue()) for i_obj in range(1, n_z + 1)]
-                z_bounded = [z_vec[obj_id - 1] for obj_id in bounded_objectives]
-                schedule_rows = extract_schedule_rows(idx, bm.var)
-
-                add_to_N_keep_nondominated(
-                    N,
-                    SolutionPoint(
-                        z=z_vec,
-                        eps=eps,
-                        z_bounded=z_bounded,
-                        status=st,
-                        proven=True,
-                        schedule=schedule_rows,
-                    ),
-                )
-                timeN += dt
-
-            elif st == GRB.TIME_LIMIT:
-                # TIME_LIMIT != infeasible
-                if accept_time_limit_incumbent and bm.m.SolCount > 0:
-                    z_vec = [float(z_defs[i_obj].expr.getValue()) for i_obj in range(1, n_z + 1)]
-                    z_bounded = [z_vec[obj_id - 1] for obj_id in bounded_objectives]
-                    schedule_rows = extract_schedule_rows(idx, bm.var)
-
+                tl = time_limit_per_iter
+
+            for _, v, eps_np in batch:
+                tracker.tick(lambda: f"STAGE 2 / Alg.5: P^eps solve v={v} eps={eps_np.tolist()}")
+
+            if pool is not None:
+                results = list(pool.map(
+                    _solve_in_worker,
+                    [v for _, v, _ in batch],
+                    [eps_np.tolist() for _, _, eps_np in batch],
+                    [tl] * len(batch),
+                    [solve_opts] * len(batch),
+                ))
+            else:
+                results = [sub.solve(v, eps_np.tolist(), tl, **solve_opts) for _, v, eps_np in batch]
+
+            # merge in grid order; re-run the skip tests first, so an eps that the
+            # serial loop would have skipped (because an earlier solve of the same
+            # round filled N / I) is counted as skipped and its result dropped
+            for (k_b, v, eps_np), res in zip(batch, results):
+                if skip_solutions(grid, k_b):
+                    skipN += 1
+
+                elif skip_infeasible(grid, k_b):
+                    skipI += 1
+
+                elif res.status == GRB.INFEASIBLE:
+                    I.append(eps_np.tolist())
+                    grid.mark_infeasible(eps_np)
+                    timeI += res.dt
+
+                elif res.z is not None:
+                    z_vec = np.asarray(res.z, dtype=np.float64)
+                    z_bounded = z_vec[bounded_cols]
                     add_to_N_keep_nondominated(
                         N,
+                        N_arr,
                         SolutionPoint(
                             z=z_vec,
-                            eps=eps,
+                            eps=eps_np.copy(),
                             z_bounded=z_bounded,
-                            status=st,
-                            proven=False,
-                            schedule=schedule_rows,
+                            status=res.status,
+                            proven=res.proven,
+                            schedule=res.schedule,
                         ),
                     )
-                    timeN += dt
+                    grid.mark_point(z_bounded)
+                    timeN += res.dt
+
                 else:
                     # unknown -> do nothing
                     pass
 
-            else:
-                # unknown -> do nothing
-                pass
-
-        v, stop = update_v(v, steps)
+            # early termination: once every remaining cell is flagged, the rest of
+            # the enumeration would only count skips, so count them in one go
+            if k < total_iters:
+                rest_N = grid.covered_N_flat[k:]
+                rest_I = grid.covered_I_flat[k:]
+                if (rest_N | rest_I).all():
+                    n_rest_N = int(np.count_nonzero(rest_N))
+                    skipN += n_rest_N
+                    skipI += rest_N.shape[0] - n_rest_N
+                    break
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     if return_metrics:
         metrics = AugEpsMetrics(
@@ -361,4 +685,4 @@ def solve_augmented_epsilon(
         )
         return N, I, metrics
 
-    return N, I
\ No newline at end of file
+    return N, I
@@ -5,17 +5,19 @@ This is where you use 10^{-E} with safe computed E.
 """
 
 from __future__ import annotations
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import List, Optional
 
-from gurobipy import GRB
+from gurobipy import GRB, LinExpr, Var
 
 from src.common.symbols import Indices
 from src.common.parameters import Parameters
 from src.common.bounds import compute_safe_E
 from src.common.solve_tracker import SolveTracker
-from src.model.build import build_stage2_base
-from src.model.zexpr import build_z_defs
+from src.model.build import BuiltModel, build_stage2_base
+from src.model.zexpr import ZEvaluator, compile_z_evaluator
 
 
 @dataclass(frozen=True)
@@ -24,20 +26,115 @@ class IdealNadir:
     z_nadir: List[float]   # length n_z
 
 
-def _eval_z_vector(z_defs: Dict[int, object], n_z: int) -> List[float]:
+@dataclass
+class _WarmStart:
     """
-    Evaluate z_1..z_n at the current model solution.
+    Incumbent of the previous ideal solve on the same model. Only the objective
+    changes between solves, so it stays feasible and is handed to the next
+    solve as a MIP start.
+    """
+    model_vars: List[Var]
+    x: Optional[List[float]] = None
 
-    IMPORTANT FIX:
-    In gurobipy, you must evaluate a LinExpr using:
-        expr.getValue()
-    NOT:
-        model.getValue(expr)
+
+def _solve_ideal_i(
+    bm: BuiltModel,
+    idx: Indices,
+    par: Parameters,
+    i: int,
+    n_z: int,
+    weight: float,
+    total: LinExpr,
+    z_eval: ZEvaluator,
+    warm: _WarmStart,
+) -> List[float]:
+    """
+    Eq.(36) for objective i on an existing Stage-2 model; returns z_1..z_n.
+    `total` is sum_j z_j (see _z_total), `z_eval` the compiled z_1..z_n and
+    `warm` the MIP start of the same model, all shared by all i.
+    """
+    z_defs = bm.ensure_z_defs(idx, par)
+
+    # Eq.(36): maximize z_i + 10^{-E} * sum_{j!=i} z_j
+    #        = (1 - 10^{-E}) * z_i + 10^{-E} * sum_j z_j
+    # built in place: no scaled copies of z_i and of the (large) total
+    obj = LinExpr()
+    obj.add(z_defs[i].expr, 1.0 - weight)
+    obj.add(total, weight)
+    bm.m.setObjective(obj, GRB.MAXIMIZE)
+    if warm.x is not None:
+        bm.m.setAttr("Start", warm.model_vars, warm.x)
+    bm.m.optimize()
+
+    # IMPORTANT:
+    # - OPTIMAL is obviously fine.
+    # - TIME_LIMIT is also fine ONLY if Gurobi found at least one feasible solution (SolCount>0).
+    # - If SolCount==0, then the solve produced no incumbent -> we cannot evaluate z-values safely.
+    if bm.m.Status not in (GRB.OPTIMAL, GRB.TIME_LIMIT) or bm.m.SolCount <= 0:
+        raise RuntimeError(
+            f"Ideal/Nadir subproblem i={i} not solved properly. "
+            f"Status={bm.m.Status}, SolCount={bm.m.SolCount}"
+        )
+
+    warm.x = bm.m.getAttr("X", warm.model_vars)
+
+    # Evaluate all z at this solution (one batched X read)
+    return z_eval.values(bm.m)
+
+
+def _z_total(bm: BuiltModel, idx: Indices, par: Parameters, n_z: int) -> LinExpr:
+    """sum_{j=1..n_z} z_j, built once per model."""
+    z_defs = bm.ensure_z_defs(idx, par)
+    total = LinExpr()
+    for j in range(1, n_z + 1):
+        total.add(z_defs[j].expr)
+    return total
+
+
+def _prepare_model(
+    bm: BuiltModel, idx: Indices, par: Parameters, n_z: int, time_limit: float | None
+) -> tuple[LinExpr, ZEvaluator, _WarmStart]:
+    """One TimeLimit, sum_j z_j, z evaluator and MIP start for all seven solves on this model."""
+    if time_limit is not None:
+        bm.m.Params.TimeLimit = float(time_limit)
+    # reuse the previous solve's basis even when presolve is on
+    bm.m.Params.LPWarmStart = 2
+    total = _z_total(bm, idx, par, n_z)
+    z_eval = compile_z_evaluator(bm.m, bm.ensure_z_defs(idx, par), n_z)
+    return total, z_eval, _WarmStart(model_vars=bm.m.getVars())
+
+
+# solver parameters _prepare_model changes on the model
+_ALG1_PARAMS = ("TimeLimit", "LPWarmStart")
+
+
+def _hand_back(bm: BuiltModel, saved: dict) -> None:
+    """
+    Leave a caller-owned model as Alg.1 found it: restore the parameters in
+    `saved` and clear the MIP start of the last ideal solve, so the next user
+    (Alg.5) neither warm-starts from an Alg.1 solution nor inherits its settings.
     """
-    out = []
-    for i in range(1, n_z + 1):
-        out.append(float(z_defs[i].expr.getValue()))
-    return out
+    for name, val in saved.items():
+        bm.m.setParam(name, val)
+    model_vars = bm.m.getVars()
+    bm.m.setAttr("Start", model_vars, [GRB.UNDEFINED] * len(model_vars))
+
+
+# per-process Stage-2 model for the parallel mode
+_WORKER: BuiltModel | None = None
+_WORKER_DATA: tuple | None = None
+
+
+def _init_worker(idx: Indices, par: Parameters, g_value: int, n_z: int, time_limit: float | None) -> None:
+    global _WORKER, _WORKER_DATA
+    _WORKER = build_stage2_base(idx, par, g_value, name="Pz")
+    _WORKER_DATA = (idx, par) + _prepare_model(_WORKER, idx, par, n_z, time_limit)
+
+
+def _solve_ideal_in_worker(i: int, n_z: int, weight: float) -> List[float]:
+    assert _WORKER is not None and _WORKER_DATA is not None
+    idx, par, total, z_eval, warm = _WORKER_DATA
+    return _solve_ideal_i(_WORKER, idx, par, i, n_z, weight, total, z_eval, warm)
 
 
 def compute_ideal_and_approx_nadir(
@@ -47,6 +144,8 @@ def compute_ideal_and_approx_nadir(
     n_z: int = 7,
     time_limit: float | None = None,
     tracker: SolveTracker | None = None,
+    base: BuiltModel | None = None,
+    n_workers: int = 1,
 ) -> IdealNadir:
     """
     Implements Eq.(36)-(40) / Algorithm 1.
@@ -61,6 +160,15 @@ def compute_ideal_and_approx_nadir(
     IMPORTANT FIX:
     - run/main.py passes 'tracker', so we must accept it here.
     - prints "=== SOLVE #k ===" for each ideal solve.
+
+    All seven solves run on ONE Stage-2 model, only swapping the objective.
+    If `base` (a Stage-2 model with the same g) is given, that model is used
+    and the caller owns and disposes it; otherwise one is built and disposed here.
+    A given `base` is handed back with its TimeLimit / LPWarmStart restored and
+    no MIP start set (the objective is left at the last ideal solve's).
+
+    n_workers > 1 runs the seven solves in min(n_workers, n_z) processes
+    instead (each with its own single-threaded Stage-2 model; `base` unused).
     """
 
     if tracker is None:
@@ -69,6 +177,9 @@ def compute_ideal_and_approx_nadir(
     idx.validate()
     par.validate(idx)
 
+    if n_workers < 1:
+        raise ValueError("n_workers must be >= 1")
+
     # Compute safe E analytically (Section 3)
     E = compute_safe_E(idx, par, n_z=n_z)
     weight = 10.0 ** (-E)
@@ -77,52 +188,54 @@ def compute_ideal_and_approx_nadir(
     z_star: List[float] = [0.0] * n_z
     z_table: List[List[float]] = [[0.0] * n_z for _ in range(n_z)]  # row i, col j
 
-    for i in range(1, n_z + 1):
-
-        # Build feasible region with fixed g (Stage 2 base model)
-        bm = build_stage2_base(idx, par, g_value, name=f"Pz{i}")
-
-        try:
-            if time_limit is not None:
-                bm.m.Params.TimeLimit = float(time_limit)
-
-            z_defs = build_z_defs(idx, par, bm.var)
-
-            # Eq.(36): maximize z_i + 10^{-E} * sum_{j!=i} z_j
-            primary = z_defs[i].expr
-            perturb = sum(z_defs[j].expr for j in range(1, n_z + 1) if j != i)
-
-            bm.m.setObjective(primary + weight * perturb, GRB.MAXIMIZE)
-
+    if n_workers > 1:
+        objs = list(range(1, n_z + 1))
+        for i in objs:
             tracker.tick(f"STAGE 2 / Alg.1: IDEAL solve i={i} (E={E}, 10^(-E)={weight:g})")
-            bm.m.optimize()
-
-            # IMPORTANT:
-            # - OPTIMAL is obviously fine.
-            # - TIME_LIMIT is also fine ONLY if Gurobi found at least one feasible solution (SolCount>0).
-            # - If SolCount==0, then the solve produced no incumbent -> we cannot evaluate z-values safely.
-            if bm.m.Status not in (GRB.OPTIMAL, GRB.TIME_LIMIT) or bm.m.SolCount <= 0:
-                raise RuntimeError(
-                    f"Ideal/Nadir subproblem i={i} not solved properly. "
-                    f"Status={bm.m.Status}, SolCount={bm.m.SolCount}"
-                )
-
-            # Evaluate all z at this solution
-            zv = _eval_z_vector(z_defs, n_z)
+        # spawn: never fork a process that already holds a Gurobi env
+        with ProcessPoolExecutor(
+            max_workers=min(n_workers, n_z),
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(idx, par, g_value, n_z, time_limit),
+        ) as pool:
+            rows = list(pool.map(
+                _solve_ideal_in_worker,
+                objs,
+                [n_z] * n_z,
+                [weight] * n_z,
+            ))
+    else:
+        # Build feasible region with fixed g (Stage 2 base model) once
+        bm = base if base is not None else build_stage2_base(idx, par, g_value, name="Pz")
+        saved = {name: bm.m.getParamInfo(name)[2] for name in _ALG1_PARAMS}
 
-            for j in range(n_z):
-                z_table[i - 1][j] = zv[j]
+        try:
+            total, z_eval, warm = _prepare_model(bm, idx, par, n_z, time_limit)
 
-            # Eq.(37)-(38): z_i^* = z_i^{rho*} - rho
-            # We safely take realized z_i value (perturbation only breaks ties)
-            z_star[i - 1] = zv[i - 1]
+            rows = []
+            for i in range(1, n_z + 1):
+                tracker.tick(f"STAGE 2 / Alg.1: IDEAL solve i={i} (E={E}, 10^(-E)={weight:g})")
+                rows.append(_solve_ideal_i(bm, idx, par, i, n_z, weight, total, z_eval, warm))
 
         finally:
             # IMPORTANT FIX (memory/stability):
-            # We create a fresh model per i; dispose it to avoid memory buildup in scalability runs.
-            bm.m.dispose()
+            # dispose the model we built to avoid memory buildup in scalability runs.
+            # A shared base model is left to its owner.
+            if base is None:
+                bm.m.dispose()
+            else:
+                _hand_back(bm, saved)
+
+    for i, zv in enumerate(rows, start=1):
+        for j in range(n_z):
+            z_table[i - 1][j] = zv[j]
+
+        # Eq.(37)-(38): z_i^* = z_i^{rho*} - rho
+        # We safely take realized z_i value (perturbation only breaks ties)
+        z_star[i - 1] = zv[i - 1]
 
     # Approx nadir: z_i^nad = min_j z_i^{j*}
     z_nad = [min(z_table[row][col] for row in range(n_z)) for col in range(n_z)]
 
-    return IdealNadir(z_ideal=z_star, z_nadir=z_nad)
\ No newline at end of file
+    return IdealNadir(z_ideal=z_star, z_nadir=z_nad)
@@ -12,7 +12,9 @@ We do this with a safe upper bound on \sum_{j\ne i} |z_j|.
 from __future__ import annotations
 import math
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
+
+import numpy as np
 
 from src.common.symbols import Indices
 from src.common.parameters import Parameters
@@ -30,14 +32,109 @@ def objective_bounds_maxform(idx: Indices, par: Parameters) -> Dict[int, ObjBoun
     Analytical SAFE bounds for z1..z7 in maximize-form.
 
     These are intentionally conservative (safe) so E is safe.
+
+    The result is a pure function of (idx, par) and is cached on `par`
+    (keyed by idx), so repeated calls for the same instance are free.
+    """
+    cached = par.__dict__.get("_bounds_cache")
+    if cached is not None and cached[0] == idx:
+        return dict(cached[1])
+
+    B = _objective_bounds_maxform(idx, par)
+    # Parameters is frozen: attach the cache without going through __setattr__
+    object.__setattr__(par, "_bounds_cache", (idx, B))
+    return dict(B)
+
+
+def member_caps(par: Parameters) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-member prefix sums used as caps / big-Ms (index 0 = dummy member):
+      nvi[i]  = v[i][0] + ... + v[i][b[i]]
+      M_hi[i] = h[i][0] + ... + h[i][a[i]]
+
+    Computed once per `par` (cumsum read at b[i] / a[i]) and cached on it.
     """
+    cached = par.__dict__.get("_member_caps")
+    if cached is not None:
+        return cached
+
+    P = par.as_arrays()
+    rows = np.arange(P.b.shape[0])
+    nvi = np.cumsum(P.v, axis=1)[rows, P.b]
+    M_hi = np.cumsum(P.h, axis=1)[rows, P.a]
+    nvi.flags.writeable = False
+    M_hi.flags.writeable = False
+
+    caps = (nvi, M_hi)
+    object.__setattr__(par, "_member_caps", caps)
+    return caps
+
+
+def tbar_total(par: Parameters) -> int:
+    """
+    sum_{j,q} tbar[j][q] over real defences and subjects (z2's denominator),
+    computed once per `par` and cached on it.
+    """
+    cached = par.__dict__.get("_tbar_total")
+    if cached is None:
+        cached = int(par.as_arrays().tbar[1:, 1:].sum())
+        object.__setattr__(par, "_tbar_total", cached)
+    return cached
+
+
+def room_change_big_m(idx: Indices, par: Parameters) -> Dict[Tuple[int, int], int]:
+    """
+    Local big-M of the room-change product at slot ell (A.24/A.26):
+        M_local[i, ell] = sum_{lbar=0..a[i] : ell-d-lbar >= 1} h[i][lbar]  (<= M_hi[i])
+    i.e. h summed over the previous slots that exist. Where it is 0,
+    shat_roomchg[i,k,ell,p] is identically 0 and is not created.
+
+    Computed once per (idx, par) and cached on `par`.
+    """
+    cached = par.__dict__.get("_room_change_big_m")
+    if cached is not None and cached[0] == idx:
+        return cached[1]
+
+    d = par.d
+    M_local = {}
+    for i in idx.I:
+        h_i = par.h[i]
+        for ell in idx.L:
+            M_local[i, ell] = sum(h_i[lbar] for lbar in range(0, min(par.a[i], ell - d - 1) + 1))
+    object.__setattr__(par, "_room_change_big_m", (idx, M_local))
+    return M_local
+
+
+def suitability_pairs(par: Parameters) -> List[Tuple[int, int, int]]:
+    """
+    (i, j, R[i][j]) for the real member/defence pairs with
+    R[i][j] = sum_q r[i][q] * tbar[j][q] != 0 (z3's coefficients),
+    computed once per `par` (one matrix product) and cached on it.
+    """
+    cached = par.__dict__.get("_suitability_pairs")
+    if cached is None:
+        P = par.as_arrays()
+        R = P.r @ P.tbar.T
+        nz = np.argwhere(R[1:, 1:] != 0) + 1
+        cached = [(i, j, int(R[i, j])) for i, j in nz.tolist()]
+        object.__setattr__(par, "_suitability_pairs", cached)
+    return cached
+
+
+def _objective_bounds_maxform(idx: Indices, par: Parameters) -> Dict[int, ObjBounds]:
     idx.validate(); par.validate(idx)
 
     B: Dict[int, ObjBounds] = {}
 
+    # member-indexed arrays, dummy index 0 dropped
+    P = par.as_arrays()
+    u_arr = P.u[1:]
+    c_arr = P.c[1:]
+    n_slots = idx.n_k * idx.n_ell * idx.n_p
+
     # z1 = - (sum u_i * j^2 * w_ij), min in paper
     # Since w is one-hot over j in [0..c[i]]: expr27 in [0 .. sum u_i*c[i]^2]
-    ub_expr27 = sum(par.u[i] * (par.c[i] ** 2) for i in idx.I)
+    ub_expr27 = int((u_arr * c_arr * c_arr).sum())
     B[1] = ObjBounds(lb=-ub_expr27, ub=0.0)
 
     # z2 = +coverage normalized in [0,1] (or 0 if denom=0)
@@ -46,34 +143,29 @@ def objective_bounds_maxform(idx: Indices, par: Parameters) -> Dict[int, ObjBoun
     # z3 = +suitability: each x can contribute at most sum_q tbar[j,q] (since r<=1)
     # Safe bound: sum_{i,j,t,k,ell,p,q} r[i,q]*tbar[j,q]*x <= sum_{i,j,t,k,ell,p,q} tbar[j,q]
     # (very loose but safe)
-    ub_z3 = (
-        len(list(idx.I)) * len(list(idx.T)) * len(list(idx.K)) * len(list(idx.L)) * len(list(idx.P))
-        * sum(par.tbar[j][q] for j in idx.J for q in idx.Q)
-    )
+    ub_z3 = idx.n_i * idx.n_t * n_slots * tbar_total(par)
     B[3] = ObjBounds(lb=0.0, ub=float(ub_z3))
 
     # z4 = -(expr30). expr30 is nonnegative-ish but safe bound:
     # term_max_potential <= sum_i u[i]*nvi[i]*(c[i]-1)
     # term_achieved >= 0 so expr30 <= that
-    nvi = {i: sum(par.v[i][lbar] for lbar in range(0, par.b[i] + 1)) for i in idx.I}
-    ub_expr30 = sum(par.u[i] * nvi[i] * max(par.c[i] - 1, 0) for i in idx.I)
+    nvi, M_hi = member_caps(par)
+    nvi, M_hi = nvi[1:], M_hi[1:]
+    ub_expr30 = int((u_arr * nvi * np.maximum(c_arr - 1, 0)).sum())
     B[4] = ObjBounds(lb=-float(ub_expr30), ub=0.0)
 
     # z5 = -(expr31). expr31 <= sum u[i]*(max(l)-1)* (#assignments)
-    max_l = max(par.l[i][k][ell] for i in idx.I0 for k in idx.K0 for ell in idx.L0)
-    ub_expr31 = sum(par.u[i] * max(max_l - 1, 0) * par.c[i] for i in idx.I)
+    max_l = int(P.l.max())
+    ub_expr31 = int((u_arr * c_arr).sum()) * max(max_l - 1, 0)
     B[5] = ObjBounds(lb=-float(ub_expr31), ub=0.0)
 
     # z6 = -(expr32). expr32 in [0, sum u[i]*n_k^2]
-    ub_expr32 = sum(par.u[i] * (idx.n_k ** 2) for i in idx.I)
+    ub_expr32 = int(u_arr.sum()) * idx.n_k ** 2
     B[6] = ObjBounds(lb=-float(ub_expr32), ub=0.0)
 
     # z7 = -(expr33). expr33 >= 0, safe upper bound:
-    # each (i,k,ell,p) shat <= sum_{lbar<=a_i} h[i][lbar]
-    ub_expr33 = 0.0
-    for i in idx.I:
-        M_hi = sum(par.h[i][lbar] for lbar in range(0, par.a[i] + 1))
-        ub_expr33 += M_hi * len(list(idx.K)) * len(list(idx.L)) * len(list(idx.P)) * par.u[i]
+    # each (i,k,ell,p) shat <= sum_{lbar<=a_i} h[i][lbar] = M_hi[i]
+    ub_expr33 = int((M_hi * u_arr).sum()) * n_slots
     B[7] = ObjBounds(lb=-float(ub_expr33), ub=0.0)
 
     return B
@@ -91,7 +183,7 @@ def compute_safe_E(idx: Indices, par: Parameters, n_z: int = 7) -> int:
         b = bounds[i]
         M += max(abs(b.lb), abs(b.ub))
 
-    # Need 10^{-E} * M < 1  =>  E > log10(M)
+    # Need 10^{-E} * M < 1  =>  E > log10(M); ceil(.)+1 keeps a full decade of margin
     if M <= 0:
         return 1
-    return int(math.floor(math.log10(M)) + 2)  # +2 gives strict safety
\ No newline at end of file
+    return max(1, math.ceil(math.log10(M)) + 1)
\ No newline at end of file
@@ -2,6 +2,8 @@
 from __future__ import annotations
 from typing import Sequence
 
+import numpy as np
+
 
 def dominates(a: Sequence[float], b: Sequence[float]) -> bool:
     """
@@ -16,4 +18,18 @@ def dominates(a: Sequence[float], b: Sequence[float]) -> bool:
             break
         if ai > bi:
             gt_some = True
-    return ge_all and gt_some
\ No newline at end of file
+    return ge_all and gt_some
+
+
+def dominates_batch(A: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Batched `dominates`: mask of the rows of A (shape (n, d)) that dominate b.
+    """
+    return (A >= b).all(axis=1) & (A > b).any(axis=1)
+
+
+def dominated_by_batch(A: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Batched `dominates(b, row)`: mask of the rows of A that b dominates.
+    """
+    return (b >= A).all(axis=1) & (b > A).any(axis=1)
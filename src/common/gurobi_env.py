@@ -0,0 +1,40 @@
+# src/common/gurobi_env.py
+from __future__ import annotations
+import atexit
+import os
+from typing import Optional, Tuple
+
+from gurobipy import Env
+
+# (pid, env): a Gurobi env must not cross a fork, so a child process that
+# inherits this module state builds its own env instead of reusing the parent's.
+_SHARED: Optional[Tuple[int, Env]] = None
+
+
+def get_shared_env() -> Env:
+    """
+    One Gurobi environment per process, created on first use and shared by
+    every model we build (one license check instead of one per model).
+
+    Started silent unless GUROBI_VERBOSE=1, and disposed at interpreter exit.
+    """
+    global _SHARED
+    pid = os.getpid()
+    if _SHARED is not None and _SHARED[0] == pid:
+        return _SHARED[1]
+
+    verbose = os.environ.get("GUROBI_VERBOSE", "0") not in ("", "0")
+    env = Env(empty=True)
+    env.setParam("OutputFlag", 1 if verbose else 0)
+    env.start()
+
+    _SHARED = (pid, env)
+    atexit.register(_dispose_shared_env, pid)
+    return env
+
+
+def _dispose_shared_env(pid: int) -> None:
+    global _SHARED
+    if _SHARED is not None and _SHARED[0] == pid == os.getpid():
+        _SHARED[1].dispose()
+        _SHARED = None
@@ -1,7 +1,9 @@
 # src/common/parameters.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 from src.common.symbols import Indices
 
@@ -41,7 +43,41 @@ class Parameters:
     # defence subject indicator (paper uses \bar{t}_{jq})
     tbar: List[List[int]]         # tbar[j][q] ∈ {0,1}
 
+    def as_arrays(self) -> "ParametersNP":
+        """
+        The same tensors as contiguous read-only int64 arrays (see ParametersNP).
+        Built on first call and cached on this instance.
+        """
+        cached = self.__dict__.get("_np")
+        if cached is None:
+            cached = ParametersNP.from_parameters(self)
+            # Parameters is frozen: attach the cache without going through __setattr__
+            object.__setattr__(self, "_np", cached)
+        return cached
+
+    def subject_supports(self) -> "SubjectSupports":
+        """
+        Nonzero supports of r and tbar (see SubjectSupports).
+        Built on first call and cached on this instance.
+        """
+        cached = self.__dict__.get("_supports")
+        if cached is None:
+            cached = SubjectSupports.from_parameters(self)
+            object.__setattr__(self, "_supports", cached)
+        return cached
+
     def validate(self, idx: Indices) -> None:
+        """
+        Checks shapes and value ranges against `idx`; raises ValueError.
+        Validation is pure, so a pass is remembered on this instance (per idx)
+        and repeated calls from the model builders are free.
+        """
+        if self.__dict__.get("_validated_for") == idx:
+            return
+        self._validate(idx)
+        object.__setattr__(self, "_validated_for", idx)
+
+    def _validate(self, idx: Indices) -> None:
         idx.validate()
 
         if self.d <= 0:
@@ -76,36 +112,35 @@ class Parameters:
         # ------------------------------------------------------------
         # Guardrails (recommended): r and tbar dummy slices + binarity
         # ------------------------------------------------------------
+        r_arr = np.asarray(self.r)
+        tbar_arr = np.asarray(self.tbar)
+
         # Dummy member i=0 must have no expertise
-        for q in idx.Q0:
-            if self.r[0][q] != 0:
-                raise ValueError("r[0][*] must be 0 (dummy member)")
+        if (r_arr[0] != 0).any():
+            raise ValueError("r[0][*] must be 0 (dummy member)")
 
         # Dummy subject q=0 must be 0 for all members
-        for i in idx.I0:
-            if self.r[i][0] != 0:
-                raise ValueError("r[*][0] must be 0 (dummy subject)")
+        if (r_arr[:, 0] != 0).any():
+            raise ValueError("r[*][0] must be 0 (dummy subject)")
 
         # Dummy defence j=0 must have no subjects
-        for q in idx.Q0:
-            if self.tbar[0][q] != 0:
-                raise ValueError("tbar[0][*] must be 0 (dummy defence)")
+        if (tbar_arr[0] != 0).any():
+            raise ValueError("tbar[0][*] must be 0 (dummy defence)")
 
         # Dummy subject q=0 must be 0 for all defences
-        for j in idx.J0:
-            if self.tbar[j][0] != 0:
-                raise ValueError("tbar[*][0] must be 0 (dummy subject)")
+        if (tbar_arr[:, 0] != 0).any():
+            raise ValueError("tbar[*][0] must be 0 (dummy subject)")
 
         # Enforce binary values for r and tbar (prevents silent data bugs)
-        for i in idx.I0:
-            for q in idx.Q0:
-                if self.r[i][q] not in (0, 1):
-                    raise ValueError(f"r[{i}][{q}] must be 0/1, got {self.r[i][q]!r}")
+        bad = _first_true((r_arr != 0) & (r_arr != 1))
+        if bad is not None:
+            i, q = bad
+            raise ValueError(f"r[{i}][{q}] must be 0/1, got {self.r[i][q]!r}")
 
-        for j in idx.J0:
-            for q in idx.Q0:
-                if self.tbar[j][q] not in (0, 1):
-                    raise ValueError(f"tbar[{j}][{q}] must be 0/1, got {self.tbar[j][q]!r}")
+        bad = _first_true((tbar_arr != 0) & (tbar_arr != 1))
+        if bad is not None:
+            j, q = bad
+            raise ValueError(f"tbar[{j}][{q}] must be 0/1, got {self.tbar[j][q]!r}")
 
         # ------------------------------------------------------------
         # 3D tensor: e
@@ -150,50 +185,42 @@ class Parameters:
         # ------------------------------------------------------------
 
         # b[i], a[i] bounds (real members only)
-        for i in idx.I:
-            bi = self.b[i]
-            ai = self.a[i]
-            if not (0 <= bi <= self.d - 1):
-                raise ValueError(f"b[{i}] must be in 0..d-1, got {bi}")
-            if not (0 <= ai <= self.d - 1):
-                raise ValueError(f"a[{i}] must be in 0..d-1, got {ai}")
+        b_arr = np.asarray(self.b[1:])
+        a_arr = np.asarray(self.a[1:])
+        bad = _first_true((b_arr < 0) | (b_arr > self.d - 1) | (a_arr < 0) | (a_arr > self.d - 1))
+        if bad is not None:
+            i = bad[0] + 1
+            if not (0 <= self.b[i] <= self.d - 1):
+                raise ValueError(f"b[{i}] must be in 0..d-1, got {self.b[i]}")
+            raise ValueError(f"a[{i}] must be in 0..d-1, got {self.a[i]}")
 
         # ------------------------------------------------------------
         # e dummy slices must be 0
         # ------------------------------------------------------------
-        for j in idx.J0:
-            for t in idx.T0:
-                if self.e[0][j][t] != 0:
-                    raise ValueError("e[0][*][*] must be 0 (dummy member)")
-
-        for i in idx.I0:
-            for t in idx.T0:
-                if self.e[i][0][t] != 0:
-                    raise ValueError("e[*][0][*] must be 0 (dummy defence)")
-
-        for i in idx.I0:
-            for j in idx.J0:
-                if self.e[i][j][0] != 0:
-                    raise ValueError("e[*][*][0] must be 0 (dummy role)")
+        e_arr = np.asarray(self.e)
+        if (e_arr[0] != 0).any():
+            raise ValueError("e[0][*][*] must be 0 (dummy member)")
+        if (e_arr[:, 0, :] != 0).any():
+            raise ValueError("e[*][0][*] must be 0 (dummy defence)")
+        if (e_arr[:, :, 0] != 0).any():
+            raise ValueError("e[*][*][0] must be 0 (dummy role)")
 
         # ------------------------------------------------------------
         # Room availability dummy room p=0 must be 0
         # ------------------------------------------------------------
-        for k in idx.K0:
-            for ell in idx.L0:
-                if self.m[k][ell][0] != 0:
-                    raise ValueError("m[*][*][0] must be 0 (dummy room)")
+        m_arr = np.asarray(self.m)
+        if (m_arr[:, :, 0] != 0).any():
+            raise ValueError("m[*][*][0] must be 0 (dummy room)")
 
         # ------------------------------------------------------------
         # Availability dummy slices for l must be 0
         # ------------------------------------------------------------
+        l_arr = np.asarray(self.l)
         for i in idx.I0:
-            for k in idx.K0:
-                if self.l[i][k][0] != 0:
-                    raise ValueError("l[*][*][0] must be 0 (dummy hour-slot)")
-            for ell in idx.L0:
-                if self.l[i][0][ell] != 0:
-                    raise ValueError("l[*][0][*] must be 0 (dummy day)")
+            if (l_arr[i, :, 0] != 0).any():
+                raise ValueError("l[*][*][0] must be 0 (dummy hour-slot)")
+            if (l_arr[i, 0, :] != 0).any():
+                raise ValueError("l[*][0][*] must be 0 (dummy day)")
 
         # ------------------------------------------------------------
         # l[i][k][ell] must be in N0 (non-negative integers)
@@ -208,16 +235,107 @@ class Parameters:
         #   We therefore enforce:
         #       l[i][k][ell] ∈ {0,1,2,...}
         #
-        for i in idx.I0:
-            for k in idx.K0:
-                for ell in idx.L0:
-                    val = self.l[i][k][ell]
-
-                    if not isinstance(val, int) or val < 0:
-                        raise ValueError(
-                            f"l[{i}][{k}][{ell}] must be a non-negative integer (N0), got {val!r}"
-                        )
-
-                    # Dummy member slice must be 0 (extra safety; also implied by checks above)
-                    if i == 0 and val != 0:
-                        raise ValueError("l[0][*][*] must be 0 (dummy member)")
\ No newline at end of file
+        # Dummy member slice must be 0 too (extra safety; also implied by checks above).
+        # A non-integer entry makes the array non-integral; only then do we fall
+        # back to per-entry type checks to find the offending index.
+        if l_arr.dtype.kind in "biu":
+            invalid = l_arr < 0
+            invalid[0] |= l_arr[0] != 0
+            bad = _first_true(invalid)
+        else:
+            bad = next(
+                (
+                    (i, k, ell)
+                    for i in idx.I0 for k in idx.K0 for ell in idx.L0
+                    if not isinstance(self.l[i][k][ell], int) or self.l[i][k][ell] < 0
+                    or (i == 0 and self.l[i][k][ell] != 0)
+                ),
+                None,
+            )
+        if bad is not None:
+            i, k, ell = bad
+            val = self.l[i][k][ell]
+            if not isinstance(val, int) or val < 0:
+                raise ValueError(
+                    f"l[{i}][{k}][{ell}] must be a non-negative integer (N0), got {val!r}"
+                )
+            raise ValueError("l[0][*][*] must be 0 (dummy member)")
+
+
+def _first_true(mask: np.ndarray) -> Optional[Tuple[int, ...]]:
+    """
+    Index of the first True entry of `mask` in row-major (nested-loop) order, or None.
+    """
+    if not mask.any():
+        return None
+    return tuple(int(x) for x in np.unravel_index(int(mask.argmax()), mask.shape))
+
+
+@dataclass(frozen=True)
+class ParametersNP:
+    """
+    Array view of Parameters: every tensor as a read-only int64 ndarray with the
+    same (n+1)-sized shape, dummy index 0 included, e.g. e -> (n_i+1, n_j+1, n_t+1).
+
+    Meant for vectorized precomputation (bounds, coefficient tables, masks);
+    convert back with .tolist() / int() before handing numbers to Gurobi.
+    """
+
+    d: int
+    e: np.ndarray
+    c: np.ndarray
+    u: np.ndarray
+    l: np.ndarray
+    r: np.ndarray
+    b: np.ndarray
+    v: np.ndarray
+    a: np.ndarray
+    h: np.ndarray
+    m: np.ndarray
+    tbar: np.ndarray
+
+    @staticmethod
+    def from_parameters(par: Parameters) -> "ParametersNP":
+        def arr(x) -> np.ndarray:
+            out = np.array(x, dtype=np.int64)
+            out.flags.writeable = False
+            return out
+
+        return ParametersNP(
+            d=par.d,
+            e=arr(par.e), c=arr(par.c), u=arr(par.u), l=arr(par.l), r=arr(par.r),
+            b=arr(par.b), v=arr(par.v), a=arr(par.a), h=arr(par.h), m=arr(par.m),
+            tbar=arr(par.tbar),
+        )
+
+
+@dataclass(frozen=True)
+class SubjectSupports:
+    """
+    Where r[i][q] and tbar[j][q] are nonzero, as ascending index lists over
+    real indices (entry 0 is an empty list for the dummy):
+        q_of_i[i] = [q : r[i][q] != 0]      i_of_q[q] = [i : r[i][q] != 0]
+        q_of_j[j] = [q : tbar[j][q] != 0]   j_of_q[q] = [j : tbar[j][q] != 0]
+
+    Lets subject-dependent terms (z3, A.10) iterate only nonzero coefficients.
+    """
+
+    q_of_i: List[List[int]]
+    i_of_q: List[List[int]]
+    q_of_j: List[List[int]]
+    j_of_q: List[List[int]]
+
+    @staticmethod
+    def from_parameters(par: Parameters) -> "SubjectSupports":
+        P = par.as_arrays()
+
+        def rows(mat: np.ndarray) -> List[List[int]]:
+            nz = mat != 0
+            nz[0, :] = False
+            nz[:, 0] = False
+            return [np.flatnonzero(row).tolist() for row in nz]
+
+        return SubjectSupports(
+            q_of_i=rows(P.r), i_of_q=rows(P.r.T),
+            q_of_j=rows(P.tbar), j_of_q=rows(P.tbar.T),
+        )
@@ -1,12 +1,46 @@
 # src/common/solve_tracker.py
 from __future__ import annotations
+import logging
+import sys
 from dataclasses import dataclass
+from typing import Callable, Union
+
+LOGGER_NAME = "momilp.solve"
+
+
+def _solve_logger() -> logging.Logger:
+    """
+    The banner logger. Unless the application configured it already, it writes
+    the same '=== SOLVE #n: label ===' block the tracker always printed to stdout.
+    Records are not held back, so banners stay in order with the other output.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("\n=== %(message)s ===\n"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
 
 @dataclass
 class SolveTracker:
     solve_id: int = 0
+    # banners are INFO records, emitted only if INFO >= level;
+    # SolveTracker(level=logging.WARNING) silences them
+    level: int = logging.INFO
 
-    def tick(self, label: str) -> int:
+    def tick(self, label: Union[str, Callable[[], str]]) -> int:
+        """
+        Counts one solve and logs its banner.
+        `label` may be a zero-arg callable, so callers in hot loops only pay
+        for building the string when the banner is actually emitted.
+        """
         self.solve_id += 1
-        print(f"\n=== SOLVE #{self.solve_id}: {label} ===\n")
-        return self.solve_id
\ No newline at end of file
+        logger = _solve_logger()
+        if logging.INFO >= max(self.level, logger.getEffectiveLevel()):
+            if callable(label):
+                label = label()
+            logger.info("SOLVE #%d: %s", self.solve_id, label)
+        return self.solve_id
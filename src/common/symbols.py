@@ -1,6 +1,8 @@
 # src/common/symbols.py
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import cached_property
+from itertools import product
 
 
 @dataclass(frozen=True)
@@ -26,54 +28,70 @@ class Indices:
     n_p: int  # rooms
     n_q: int  # research subjects
 
+    # Ranges are immutable, so each one is built on first access and cached in
+    # the instance __dict__ (cached_property bypasses the frozen __setattr__).
+
     # ---------- include dummy 0 ----------
-    @property
+    @cached_property
     def I0(self): return range(0, self.n_i + 1)
 
-    @property
+    @cached_property
     def J0(self): return range(0, self.n_j + 1)
 
-    @property
+    @cached_property
     def T0(self): return range(0, self.n_t + 1)
 
-    @property
+    @cached_property
     def K0(self): return range(0, self.n_k + 1)
 
-    @property
+    @cached_property
     def L0(self): return range(0, self.n_ell + 1)
 
-    @property
+    @cached_property
     def P0(self): return range(0, self.n_p + 1)
 
-    @property
+    @cached_property
     def Q0(self): return range(0, self.n_q + 1)
 
     # ---------- real objects only ----------
-    @property
+    @cached_property
     def I(self): return range(1, self.n_i + 1)
 
-    @property
+    @cached_property
     def J(self): return range(1, self.n_j + 1)
 
-    @property
+    @cached_property
     def T(self): return range(1, self.n_t + 1)
 
-    @property
+    @cached_property
     def K(self): return range(1, self.n_k + 1)
 
-    @property
+    @cached_property
     def L(self): return range(1, self.n_ell + 1)
 
-    @property
+    @cached_property
     def P(self): return range(1, self.n_p + 1)
 
-    @property
+    @cached_property
     def Q(self): return range(1, self.n_q + 1)
 
+    # ---------- cross-products of real objects (objective blocks) ----------
+    @cached_property
+    def TKLP(self): return tuple(product(self.T, self.K, self.L, self.P))
+
+    @cached_property
+    def JTP(self): return tuple(product(self.J, self.T, self.P))
+
     # ---------- guardrails ----------
     def validate(self) -> None:
+        # a pass is remembered on the instance (the counts are immutable)
+        if self.__dict__.get("_validated"):
+            return
+
         # validate counts
-        for name, v in vars(self).items():
+        # (dataclass fields only: vars(self) also holds the cached ranges)
+        for f in fields(self):
+            name, v = f.name, getattr(self, f.name)
             if not isinstance(v, int) or v < 0:
                 raise ValueError(f"{name} must be a non-negative int, got {v!r}")
 
@@ -86,6 +104,8 @@ class Indices:
         if self.n_p > 0 and min(self.P) != 1: raise ValueError("P must start at 1")
         if self.n_q > 0 and min(self.Q) != 1: raise ValueError("Q must start at 1")
 
+        object.__setattr__(self, "_validated", True)
+
     def is_dummy(self, *, i=None, j=None, t=None, k=None, ell=None, p=None, q=None) -> bool:
         """Utility for debugging: true if any provided index equals 0."""
         return any(v == 0 for v in [i, j, t, k, ell, p, q] if v is not None)
\ No newline at end of file
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import csv
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 
 def write_csv(path: str | Path, fieldnames: List[str], rows: Iterable[Dict]) -> None:
@@ -11,7 +11,56 @@ def write_csv(path: str | Path, fieldnames: List[str], rows: Iterable[Dict]) ->
     path.parent.mkdir(parents=True, exist_ok=True)
 
     with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
\ No newline at end of file
+        w = csv.writer(f)
+        w.writerow(fieldnames)
+        w.writerows(_row_tuples(fieldnames, rows))
+
+
+def _row_values(fieldnames: List[str], known: frozenset, r: Dict) -> Tuple:
+    """
+    One dict row -> plain tuple in header order, for the C-level csv.writer.
+    Matches DictWriter's defaults: missing keys write "" (restval), and keys
+    not in the header raise ValueError (extrasaction="raise").
+    """
+    if not known.issuperset(r.keys()):
+        wrong = [k for k in r if k not in known]
+        raise ValueError("dict contains fields not in fieldnames: " + ", ".join(map(repr, wrong)))
+    return tuple(r.get(k, "") for k in fieldnames)
+
+
+def _row_tuples(fieldnames: List[str], rows: Iterable[Dict]) -> Iterator[Tuple]:
+    known = frozenset(fieldnames)
+    for r in rows:
+        yield _row_values(fieldnames, known, r)
+
+
+class CsvRowWriter:
+    """
+    Incremental CSV writer: header on open, one row at a time afterwards.
+
+    Each row is flushed, so a long experiment that crashes (or is killed)
+    still leaves every finished row on disk.
+    """
+
+    def __init__(self, path: str | Path, fieldnames: List[str]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = self.path.open("w", newline="", encoding="utf-8")
+        self._fieldnames = list(fieldnames)
+        self._known = frozenset(self._fieldnames)
+        self._w = csv.writer(self._f)
+        self._w.writerow(self._fieldnames)
+        self._f.flush()
+
+    def writerow(self, row: Dict) -> None:
+        self._w.writerow(_row_values(self._fieldnames, self._known, row))
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self) -> "CsvRowWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -2,8 +2,11 @@
 from __future__ import annotations
 from dataclasses import dataclass
 import random
+from bisect import bisect_left
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 @dataclass(frozen=True)
 class SelfProbs:
     # conditional probs p(alpha|alpha) for alpha in {0,1,2,...}
@@ -51,16 +54,42 @@ def generate_availability_chain(
     warmup: int,
     diag_probs: Dict[int, float],
     has_two_available_states: bool,
-) -> List[List[int]]:
+) -> np.ndarray:
     """
-    Returns matrix [k][ell] (1-indexed in your Parameters tensor; here we return python 1..n)
+    Returns an int8 array of shape (n_k+1, n_ell+1), indexed [k, ell] with the
+    dummy row/column 0 left at 0 (same layout as the Parameters tensors)
     Values:
       - 0 = unavailable
       - 1,2 = available “levels” (lik)
       - 1 = available (mkp)
     """
+    return generate_availability_chains(
+        rng=rng, n=1, n_k=n_k, n_ell=n_ell, d=d, warmup=warmup,
+        diag_probs=diag_probs, has_two_available_states=has_two_available_states,
+    )[1]
+
+def generate_availability_chains(
+    *,
+    rng: random.Random,
+    n: int,
+    n_k: int,
+    n_ell: int,
+    d: int,
+    warmup: int,
+    diag_probs: Dict[int, float],
+    has_two_available_states: bool,
+) -> np.ndarray:
+    """
+    n independent availability matrices (one per member / room) in one call:
+    an int8 array of shape (n+1, n_k+1, n_ell+1), slab 0 is the dummy.
+    Slab s is exactly what the s-th of n successive generate_availability_chain
+    calls on the same rng returns; the transition table is only built once.
+    Every day still restarts from state 0 with its own warm-up.
+    """
     if warmup < 0:
         raise ValueError("warmup must be >= 0")
+    if n < 0:
+        raise ValueError("n must be >= 0")
 
     # states for Markov: base states are {0,1} or {0,1,2}
     base_states = sorted(diag_probs.keys())
@@ -71,15 +100,11 @@ def generate_availability_chain(
     # proceed to 0e2 ... then to 0. (For d=2, there is only 0e1).  [oai_citation:11‡1-s2.0-S0377221723005003-main.pdf](sediment://file_00000000a254720a9b4556c0e2d569da)
     forced_len = max(d - 1, 0)
 
-    def step_transition(curr: int) -> int:
-        # transient forced-zero states are encoded as negative integers: -1,-2,...,-(d-1)
-        if curr < 0:
-            nxt = curr - 1
-            if abs(nxt) > forced_len:
-                return 0
-            return nxt
-
-        # normal base state
+    # Transition table per base state, built once: the target states and the
+    # running sums of their probabilities (accumulated in the same order as
+    # _sample_next, so sampling consumes the same RNG stream with identical results).
+    table: Dict[int, Tuple[List[int], List[float]]] = {}
+    for curr in base_states:
         probs: List[Tuple[int, float]] = []
 
         # stay
@@ -102,27 +127,42 @@ def generate_availability_chain(
             # renormalize safely
             probs = [(st, p / s) for st, p in probs]
 
-        return _sample_next(rng, probs)
-
-    out: List[List[int]] = [[0] * (n_ell + 1) for _ in range(n_k + 1)]  # 1-indexed
+        cum: List[float] = []
+        acc = 0.0
+        for _, p in probs:
+            acc += p
+            cum.append(acc)
+        # one extra target so a u above the last running sum (rounding) maps to
+        # the last state, as in _sample_next
+        targets = [st for st, _ in probs]
+        table[curr] = (targets + targets[-1:], cum)
+
+    out = np.zeros((n + 1, n_k + 1, n_ell + 1), dtype=np.int8)  # 1-indexed
+    row = [0] * n_ell
+    rand = rng.random
+    n_steps = warmup + n_ell
 
     # paper initializes ell=1 “as if ell=0 was 0” and uses warm-up per day and per τ.  [oai_citation:12‡1-s2.0-S0377221723005003-main.pdf](sediment://file_00000000a254720a9b4556c0e2d569da)
-    for k in range(1, n_k + 1):
-        # start from base state 0
-        state = 0
-
-        # warm-up
-        for _ in range(warmup):
-            state = step_transition(state)
-
-        # actual sequence for ell=1..n_ell
-        for ell in range(1, n_ell + 1):
-            state = step_transition(state)
-
-            if state < 0:
-                out[k][ell] = 0
-            else:
-                out[k][ell] = state  # 0/1/2
+    # One flat loop per day: `warmup` burn-in steps, then ell=1..n_ell.
+    for slab in range(1, n + 1):
+        for k in range(1, n_k + 1):
+            # start from base state 0
+            state = 0
+
+            for step in range(n_steps):
+                if state < 0:
+                    # transient forced-zero states are encoded as negative integers: -1,-2,...,-(d-1)
+                    state = state - 1 if state > -forced_len else 0
+                else:
+                    # normal base state: first state whose running sum reaches u
+                    targets, cum = table[state]
+                    state = targets[bisect_left(cum, rand())]
+
+                if step >= warmup:
+                    # forced-zero states read as 0, base states as 0/1/2
+                    row[step - warmup] = state if state > 0 else 0
+
+            out[slab, k, 1:] = row
 
     return out
 
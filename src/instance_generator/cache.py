@@ -0,0 +1,56 @@
+#src/instance_generator/cache.py
+
+from __future__ import annotations
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+from src.common.symbols import Indices
+from src.common.parameters import Parameters
+from src.instance_generator.config import InstanceSize, PaperKnobs
+from src.instance_generator.generator import GENERATOR_VERSION, generate_instance
+
+DEFAULT_CACHE_DIR = Path("data/cache/instances")
+
+
+def instance_key(size: InstanceSize, knobs: PaperKnobs, seed: int) -> str:
+    """
+    Content address of a generated instance: the spec plus GENERATOR_VERSION
+    (frozen dataclass reprs are deterministic).
+    """
+    spec = repr((GENERATOR_VERSION, size, knobs, seed))
+    return hashlib.blake2b(spec.encode("utf-8")).hexdigest()[:16]
+
+
+def cached_generate_instance(
+    size: InstanceSize,
+    knobs: PaperKnobs,
+    *,
+    seed: int,
+    cache_dir: str | Path = DEFAULT_CACHE_DIR,
+) -> tuple[Indices, Parameters]:
+    """
+    generate_instance() with an on-disk pickle cache keyed by instance_key().
+    A missing or unreadable entry is regenerated and rewritten atomically.
+    """
+    cache_dir = Path(cache_dir)
+    path = cache_dir / f"{instance_key(size, knobs, seed)}.pkl"
+
+    if path.exists():
+        try:
+            with path.open("rb") as f:
+                idx, par = pickle.load(f)
+            return idx, par
+        except Exception:
+            pass
+
+    idx, par = generate_instance(size, knobs, seed=seed)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        pickle.dump((idx, par), f, protocol=5)
+    os.replace(tmp, path)
+
+    return idx, par
@@ -2,25 +2,56 @@
 
 from __future__ import annotations
 import json
-from dataclasses import asdict
+from dataclasses import asdict, fields
 from pathlib import Path
 
+import numpy as np
+
 from src.common.symbols import Indices
 from src.common.parameters import Parameters
 
+# Instances are stored as compressed .npz (one array per Parameters tensor, the
+# Indices as a small JSON string). Paths ending in .json use the legacy text
+# format, so previously saved instances keep loading.
+
+def _compact(values) -> np.ndarray:
+    arr = np.asarray(values, dtype=np.int64)
+    if arr.size == 0 or (arr.min() >= np.iinfo(np.int8).min and arr.max() <= np.iinfo(np.int8).max):
+        return arr.astype(np.int8)
+    return arr
+
 def save_instance(path: str | Path, idx: Indices, par: Parameters) -> None:
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    payload = {
-        "idx": asdict(idx),
-        "par": asdict(par),
-    }
-    path.write_text(json.dumps(payload), encoding="utf-8")
+    if path.suffix == ".json":
+        payload = {
+            "idx": asdict(idx),
+            "par": asdict(par),
+        }
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        return
+
+    arrays = {f.name: _compact(getattr(par, f.name)) for f in fields(par) if f.name != "d"}
+    with path.open("wb") as fh:
+        np.savez_compressed(fh, idx=np.array(json.dumps(asdict(idx))), d=np.array(par.d), **arrays)
 
-def load_instance(path: str | Path) -> tuple[Indices, Parameters]:
+def load_instance(path: str | Path, *, validate: bool = True) -> tuple[Indices, Parameters]:
+    """
+    validate=False skips par.validate(idx), for callers re-loading many
+    instances this code saved itself.
+    """
     path = Path(path)
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    idx = Indices(**payload["idx"])
-    par = Parameters(**payload["par"])
-    par.validate(idx)
-    return idx, par
\ No newline at end of file
+    if path.suffix == ".json":
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        idx = Indices(**payload["idx"])
+        par = Parameters(**payload["par"])
+    else:
+        with np.load(path, allow_pickle=False) as data:
+            idx = Indices(**json.loads(str(data["idx"])))
+            par = Parameters(
+                d=int(data["d"]),
+                **{f.name: data[f.name].tolist() for f in fields(Parameters) if f.name != "d"},
+            )
+    if validate:
+        par.validate(idx)
+    return idx, par
@@ -7,11 +7,13 @@ We need two builders:
 """
 
 from __future__ import annotations
+import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional
 
 from gurobipy import Model, GRB, quicksum
 
+from src.common.gurobi_env import get_shared_env
 from src.common.symbols import Indices
 from src.common.parameters import Parameters
 from src.model.variables import Vars, build_variables
@@ -23,9 +25,38 @@ from src.model.zexpr import build_z_defs
 class BuiltModel:
     m: Model
     var: Vars
+    # z_1..z_7 LinExprs, filled by the first algorithm that needs them, so a
+    # Stage-2 model shared between Alg.1 and Alg.5 builds them only once
+    z_defs: Optional[Dict[int, object]] = None
+    # built with names=True (readable LP / IIS files)
+    names: bool = False
 
+    def ensure_z_defs(self, idx: Indices, par: Parameters) -> Dict[int, object]:
+        if self.z_defs is None:
+            self.z_defs = build_z_defs(idx, par, self.var)
+        return self.z_defs
 
-def _add_all_constraints_with_fixed_g(m: Model, idx: Indices, par: Parameters, var: Vars, g_value: int) -> None:
+
+def configure_solver(m: Model) -> None:
+    """
+    Solver settings shared by every model we build:
+      - silent (no console log, no log file) unless GUROBI_VERBOSE=1
+      - Threads fixed to 1 (no core probing; parallelism comes from worker processes)
+    """
+    verbose = os.environ.get("GUROBI_VERBOSE", "0") not in ("", "0")
+    m.Params.OutputFlag = 1 if verbose else 0
+    m.Params.LogToConsole = 1 if verbose else 0
+    m.Params.LogFile = ""
+    m.Params.Threads = 1
+    try:
+        m.Params.ConcurrentMIP = 1
+    except Exception:
+        pass
+
+
+def _add_all_constraints_with_fixed_g(
+    m: Model, idx: Indices, par: Parameters, var: Vars, g_value: int, *, names: bool = False
+) -> None:
     # A.1-A.2
     C.add_A1_complete_committee_definition(m, idx, var)
     C.add_A2_single_committee_assignment(m, idx, var)
@@ -33,7 +64,8 @@ def _add_all_constraints_with_fixed_g(m: Model, idx: Indices, par: Parameters, v
     # A.3 fixed to g
     C.add_A3_total_scheduled_equals_g_value(m, idx, var, g_value)
 
-    # A.4-A.11
+    # A.4-A.11 (xbar first: A.4, A.5, A.10 and A.17 are written over it)
+    C.add_xbar_definition(m, idx, var)
     C.add_A4_committee_member_eligibility(m, idx, par, var)
     C.add_A5_member_max_committees(m, idx, par, var)
     C.add_A6_member_time_slot_availability(m, idx, par, var)
@@ -56,45 +88,41 @@ def _add_all_constraints_with_fixed_g(m: Model, idx: Indices, par: Parameters, v
     C.add_A22_days_count_uniqueness(m, idx, var)
 
     # A.23-A.26
-    C.add_A23_A26_room_change_penalty(m, idx, par, var)
+    C.add_A23_A26_room_change_penalty(m, idx, par, var, names=names)
 
 
-def build_stage2_base(idx: Indices, par: Parameters, g_value: int, name: str = "P") -> BuiltModel:
+def build_stage2_base(
+    idx: Indices, par: Parameters, g_value: int, name: str = "P", *, names: bool = False
+) -> BuiltModel:
     """
     Builds the feasible region X with fixed g (Stage 2 problems).
     No objective set here.
+
+    names=True names every variable and row family (e.g. for an IIS file);
+    by default the auxiliary ones are left unnamed.
     """
     idx.validate(); par.validate(idx)
-    m = Model(name)
-    m.Params.OutputFlag = 0
-    m.Params.Threads = 1
-    try:
-        m.Params.ConcurrentMIP = 1
-    except Exception:
-        pass
+    m = Model(name, env=get_shared_env())
+    configure_solver(m)
 
-    var = build_variables(m, idx)
-    _add_all_constraints_with_fixed_g(m, idx, par, var, g_value)
+    var = build_variables(m, idx, par, names=names)
+    _add_all_constraints_with_fixed_g(m, idx, par, var, g_value, names=names)
 
-    return BuiltModel(m=m, var=var)
+    return BuiltModel(m=m, var=var, names=names)
 
 
-def build_stage1_g(idx: Indices, par: Parameters, name: str = "Stage1_g") -> BuiltModel:
+def build_stage1_g(idx: Indices, par: Parameters, name: str = "Stage1_g", *, names: bool = False) -> BuiltModel:
     idx.validate(); par.validate(idx)
-    m = Model(name)
-    m.Params.OutputFlag = 0
-    m.Params.Threads = 1
-    try:
-        m.Params.ConcurrentMIP = 1
-    except Exception:
-        pass
+    m = Model(name, env=get_shared_env())
+    configure_solver(m)
 
-    var = build_variables(m, idx)
+    var = build_variables(m, idx, par, names=names)
 
     # Keep only constraints needed for feasibility of scheduling g*
     C.add_A1_complete_committee_definition(m, idx, var)
     C.add_A2_single_committee_assignment(m, idx, var)
 
+    C.add_xbar_definition(m, idx, var)
     C.add_A4_committee_member_eligibility(m, idx, par, var)
     C.add_A5_member_max_committees(m, idx, par, var)
     C.add_A6_member_time_slot_availability(m, idx, par, var)
@@ -108,4 +136,4 @@ def build_stage1_g(idx: Indices, par: Parameters, name: str = "Stage1_g") -> Bui
         GRB.MAXIMIZE
     )
 
-    return BuiltModel(m=m, var=var)
\ No newline at end of file
+    return BuiltModel(m=m, var=var, names=names)
\ No newline at end of file
@@ -1,10 +1,14 @@
 # src/model/constraints.py
 from __future__ import annotations
 
-from gurobipy import Model, quicksum
+from typing import List, Tuple
+
+import numpy as np
+from gurobipy import GRB, LinExpr, Model, quicksum
 
 from src.common.symbols import Indices
 from src.common.parameters import Parameters
+from src.common.bounds import member_caps, room_change_big_m
 from src.model.variables import Vars
 
 
@@ -74,18 +78,50 @@ def add_A3_total_scheduled_equals_g_value(m: Model, idx: Indices, var: Vars, g_v
     )
 
 
+def add_xbar_definition(m: Model, idx: Indices, var: Vars) -> None:
+    """
+    Aggregate of x over time and room (model-building aid, not in the paper):
+        xbar[i,j,t] = sum_{k,ell,p} x[i,j,t,k,ell,p]
+    for all i,j,t. A.4, A.5, A.10 and A.17 are written over xbar, so the
+    full x enumeration is built once instead of once per constraint family.
+    """
+    idx.validate()
+    m.addConstrs(
+        (
+            var.xbar[i, j, t]
+            == quicksum(var.x[i, j, t, k, ell, p] for k in idx.K for ell in idx.L for p in idx.P)
+            for i in idx.I for j in idx.J for t in idx.T
+        ),
+        name="xbar_def",
+    )
+
+
 def add_A4_committee_member_eligibility(m: Model, idx: Indices, par: Parameters, var: Vars) -> None:
     """
     (A.4) Member eligibility:
-        sum_{k,ell,p} x[i,j,t,k,ell,p] <= e[i][j][t]
+        sum_{k,ell,p} x[i,j,t,k,ell,p] = xbar[i,j,t] <= e[i][j][t]
     for all i,j,t.
+
+    Cells with e[i][j][t] = 0 only force their x[i,j,t,*,*,*] to 0, so those x
+    get UB = 0 instead of a row (as in A.6); rows are added for e = 1 only.
     """
     idx.validate(); par.validate(idx)
+    eligible = par.as_arrays().e >= 1
+
+    ineligible = (np.argwhere(~eligible[1:, 1:, 1:]) + 1).tolist()  # real (i, j, t) cells
+    blocked = [
+        var.x[i, j, t, k, ell, p]
+        for i, j, t in ineligible
+        for k in idx.K for ell in idx.L for p in idx.P
+    ]
+    if blocked:
+        m.setAttr("UB", blocked, [0.0] * len(blocked))
+
     m.addConstrs(
         (
-            quicksum(var.x[i, j, t, k, ell, p] for k in idx.K for ell in idx.L for p in idx.P)
-            <= par.e[i][j][t]
+            var.xbar[i, j, t] <= par.e[i][j][t]
             for i in idx.I for j in idx.J for t in idx.T
+            if eligible[i, j, t]
         ),
         name="A4_committee_member_eligibility",
     )
@@ -94,16 +130,13 @@ def add_A4_committee_member_eligibility(m: Model, idx: Indices, par: Parameters,
 def add_A5_member_max_committees(m: Model, idx: Indices, par: Parameters, var: Vars) -> None:
     """
     (A.5) Max number of committees per member:
-        sum_{j,t,k,ell,p} x[i,j,t,k,ell,p] <= c[i]
+        sum_{j,t,k,ell,p} x[i,j,t,k,ell,p] = sum_{j,t} xbar[i,j,t] <= c[i]
     for all i.
     """
     idx.validate(); par.validate(idx)
     m.addConstrs(
         (
-            quicksum(
-                var.x[i, j, t, k, ell, p]
-                for j in idx.J for t in idx.T for k in idx.K for ell in idx.L for p in idx.P
-            ) <= par.c[i]
+            quicksum(var.xbar[i, j, t] for j in idx.J for t in idx.T) <= par.c[i]
             for i in idx.I
         ),
         name="A5_member_max_committees",
@@ -115,13 +148,34 @@ def add_A6_member_time_slot_availability(m: Model, idx: Indices, par: Parameters
     (A.6) Member availability per slot:
         sum_{j,t,p} x[i,j,t,k,ell,p] <= 1{ l[i][k][ell] >= 1 }
     for all i,k,ell.
+
+    Built in its equivalent reduced form:
+      - l[i][k][ell] = 0: the row forces every x[i,*,*,k,ell,*] to 0, so those
+        x get UB = 0 instead of a row.
+      - l[i][k][ell] >= 1: the row (<= 1) is implied by A.7, whose windows
+        [s, s+d-1] cover every slot when d <= n_ell; it is only added when
+        A.7 is empty (d > n_ell).
     """
     idx.validate(); par.validate(idx)
+    avail = par.as_arrays().l >= 1
+
+    unavailable = (np.argwhere(~avail[1:, 1:, 1:]) + 1).tolist()  # real (i, k, ell) cells
+    blocked = [
+        var.x[i, j, t, k, ell, p]
+        for i, k, ell in unavailable
+        for j in idx.J for t in idx.T for p in idx.P
+    ]
+    if blocked:
+        m.setAttr("UB", blocked, [0.0] * len(blocked))
+
+    if par.d <= idx.n_ell:
+        return
+
     m.addConstrs(
         (
-            quicksum(var.x[i, j, t, k, ell, p] for j in idx.J for t in idx.T for p in idx.P)
-            <= (1 if par.l[i][k][ell] >= 1 else 0)
+            quicksum(var.x[i, j, t, k, ell, p] for j in idx.J for t in idx.T for p in idx.P) <= 1
             for i in idx.I for k in idx.K for ell in idx.L
+            if avail[i, k, ell]
         ),
         name="A6_member_time_slot_availability",
     )
@@ -131,6 +185,9 @@ def add_A7_member_no_overlap_duration(m: Model, idx: Indices, par: Parameters, v
     """
     (A.7) Member non-overlap for defence duration d:
     For each i,k and each start slot s, at most one assignment in [s, s+d-1].
+
+    Adjacent windows share d-1 slots, so the x of each slot (i,k,ell) are
+    looked up once and every window is assembled from those lists.
     """
     idx.validate(); par.validate(idx)
     d = par.d
@@ -138,15 +195,13 @@ def add_A7_member_no_overlap_duration(m: Model, idx: Indices, par: Parameters, v
         return
 
     start_ells = range(1, idx.n_ell - d + 2)
+    slot_x = {
+        (i, k, ell): [var.x[i, j, t, k, ell, p] for j in idx.J for t in idx.T for p in idx.P]
+        for i in idx.I for k in idx.K for ell in idx.L
+    }
     m.addConstrs(
         (
-            quicksum(
-                var.x[i, j, t, k, ell, p]
-                for j in idx.J
-                for t in idx.T
-                for ell in range(start_ell, start_ell + d)
-                for p in idx.P
-            ) <= 1
+            quicksum([xv for ell in range(start_ell, start_ell + d) for xv in slot_x[i, k, ell]]) <= 1
             for i in idx.I for k in idx.K for start_ell in start_ells
         ),
         name="A7_member_no_overlap_duration",
@@ -173,6 +228,8 @@ def add_A9_room_no_overlap_duration(m: Model, idx: Indices, par: Parameters, var
     """
     (A.9) Room non-overlap for defence duration d:
     For each k,p and each start slot s, at most one defence in [s, s+d-1].
+
+    Windows are assembled from per-slot y_def lists, as in A.7.
     """
     idx.validate(); par.validate(idx)
     d = par.d
@@ -180,9 +237,13 @@ def add_A9_room_no_overlap_duration(m: Model, idx: Indices, par: Parameters, var
         return
 
     start_ells = range(1, idx.n_ell - d + 2)
+    slot_y = {
+        (k, ell, p): [var.y_def[j, k, ell, p] for j in idx.J]
+        for k in idx.K for ell in idx.L for p in idx.P
+    }
     m.addConstrs(
         (
-            quicksum(var.y_def[j, k, ell, p] for j in idx.J for ell in range(start_ell, start_ell + d)) <= 1
+            quicksum([yv for ell in range(start_ell, start_ell + d) for yv in slot_y[k, ell, p]]) <= 1
             for k in idx.K for p in idx.P for start_ell in start_ells
         ),
         name="A9_room_no_overlap_duration",
@@ -195,16 +256,24 @@ def add_A10_subject_coverage_count(m: Model, idx: Indices, par: Parameters, var:
         sum_{i0 in I0} i0 * s[i0,j,q]
           =
         sum_{i,t,k,ell,p} r[i,q] * tbar[j,q] * x[i,j,t,k,ell,p]
+          =
+        sum_{i,t} r[i,q] * tbar[j,q] * xbar[i,j,t]
     for all j,q.
+
+    r and tbar are binary (validated), so the coefficient is 1 exactly for the
+    members i in I_q = {i : r[i,q] = 1} when tbar[j,q] = 1, and 0 otherwise;
+    only those terms are built.
     """
     idx.validate(); par.validate(idx)
+    I_q = par.subject_supports().i_of_q
     m.addConstrs(
         (
             quicksum(i0 * var.s[i0, j, q] for i0 in idx.I0)
             ==
             quicksum(
-                par.r[i][q] * par.tbar[j][q] * var.x[i, j, t, k, ell, p]
-                for i in idx.I for t in idx.T for k in idx.K for ell in idx.L for p in idx.P
+                var.xbar[i, j, t]
+                for i in (I_q[q] if par.tbar[j][q] == 1 else ())
+                for t in idx.T
             )
             for j in idx.J for q in idx.Q
         ),
@@ -276,55 +345,53 @@ def add_A13_A16_compactness(m: Model, idx: Indices, par: Parameters, var: Vars)
     idx.validate(); par.validate(idx)
 
     d = par.d
+    nvi, _ = member_caps(par)
+    M_v = {i: int(nvi[i]) for i in idx.I}  # Big-M: sum_{lbar=0..b_i} v[i][lbar]
 
-    for i in idx.I:
-        b_i = par.b[i]  # 0..d-1
+    # sum_p y_mem[i,k,ell,p] per slot, built once and reused as A and inside B
+    A = {
+        (i, k, ell): quicksum(var.y_mem[i, k, ell, p] for p in idx.P)
+        for i in idx.I for k in idx.K for ell in idx.L
+    }
 
-        # Big-M for compactness: sum_{lbar=0..b_i} v[i][lbar]
-        M_vi = 0
-        if par.v[i]:
-            M_vi = sum(par.v[i][lbar] for lbar in range(0, b_i + 1))
+    # (A.13) sbar >= 0  (usually already by variable lower bound, but we keep it explicit we remove it to make the model faster)
 
-        for k in idx.K:
-            for ell in idx.L:
-                A = quicksum(var.y_mem[i, k, ell, p] for p in idx.P)
-
-                # (A.13) sbar >= 0  (usually already by variable lower bound, but we keep it explicit we remove it to make the model faster)
-                #m.addConstr(
-                   # var.sbar_comp[i, k, ell] >= 0,
-                   # name=f"A13_comp_nonneg_i{i}_k{k}_ell{ell}",
-                #)
-
-                # (A.14) sbar <= M_vi * A   (A.14 applies for ALL ell)
-                m.addConstr(
-                    var.sbar_comp[i, k, ell] <= M_vi * A,
-                    name=f"A14_comp_ub1_i{i}_k{k}_ell{ell}",
-                )
-
-                # A.15 and A.16: only for ell = d..n_ell (paper)
-                if ell < d:
-                    # Paper does not explicitly add A.15/A.16 here.
-                    # We keep it faithful: just don't add them for ell < d.
-                    continue
-
-                # Build B only with valid previous slots (ell - d - lbar >= 1)
-                B = quicksum(
-                    par.v[i][lbar] * quicksum(var.y_mem[i, k, ell - d - lbar, p] for p in idx.P)
-                    for lbar in range(0, b_i + 1)
-                    if (ell - d - lbar) >= 1
-                )
-
-                # (A.15) sbar <= B
-                m.addConstr(
-                    var.sbar_comp[i, k, ell] <= B,
-                    name=f"A15_comp_ub2_i{i}_k{k}_ell{ell}",
-                )
-
-                # (A.16) sbar >= B - M_vi * (1 - A)
-                m.addConstr(
-                    var.sbar_comp[i, k, ell] >= B - M_vi * (1 - A),
-                    name=f"A16_comp_lb_i{i}_k{k}_ell{ell}",
-                )
+    # (A.14) sbar <= M_vi * A   (A.14 applies for ALL ell)
+    m.addConstrs(
+        (
+            var.sbar_comp[i, k, ell] <= M_v[i] * A[i, k, ell]
+            for i in idx.I for k in idx.K for ell in idx.L
+        ),
+        name="A14_comp_ub1",
+    )
+
+    # A.15 and A.16: only for ell = d..n_ell (paper); for ell < d the paper
+    # does not add them, and we keep it faithful.
+    # B only uses valid previous slots (ell - d - lbar >= 1)
+    B = {
+        (i, k, ell): quicksum(
+            par.v[i][lbar] * A[i, k, ell - d - lbar]
+            for lbar in range(0, par.b[i] + 1)
+            if (ell - d - lbar) >= 1
+        )
+        for i in idx.I for k in idx.K for ell in idx.L
+        if ell >= d
+    }
+
+    # (A.15) sbar <= B
+    m.addConstrs(
+        (var.sbar_comp[i, k, ell] <= B[i, k, ell] for (i, k, ell) in B),
+        name="A15_comp_ub2",
+    )
+
+    # (A.16) sbar >= B - M_vi * (1 - A)
+    m.addConstrs(
+        (
+            var.sbar_comp[i, k, ell] >= B[i, k, ell] - M_v[i] * (1 - A[i, k, ell])
+            for (i, k, ell) in B
+        ),
+        name="A16_comp_lb",
+    )
 
 
 # =============================================================================
@@ -336,24 +403,25 @@ def add_A17_workload_definition(m: Model, idx: Indices, par: Parameters, var: Va
     (A.17) Workload definition (one-hot selector w):
         sum_{jc=0..c[i]} jc * w[i,jc]
           =
-        sum_{j,t,k,ell,p} x[i,j,t,k,ell,p]
+        sum_{j,t,k,ell,p} x[i,j,t,k,ell,p] = sum_{j,t} xbar[i,j,t]
     """
     idx.validate(); par.validate(idx)
 
-    for i in idx.I:
-        jcounts = range(0, par.c[i] + 1)
-
-        lhs = quicksum(jc * var.w[i, jc] for jc in jcounts)
-        rhs = quicksum(
-            var.x[i, j, t, k, ell, p]
-            for j in idx.J for t in idx.T for k in idx.K for ell in idx.L for p in idx.P
-        )
-
-        m.addConstr(lhs == rhs, name=f"A17_workload_def_i{i}")
+    m.addConstrs(
+        (
+            quicksum(jc * var.w[i, jc] for jc in range(0, par.c[i] + 1))
+            ==
+            quicksum(var.xbar[i, j, t] for j in idx.J for t in idx.T)
+            for i in idx.I
+        ),
+        name="A17_workload_def",
+    )
 
-        # Optional: forbid selecting jc > c[i] (since w may be defined over a larger range)
-        for jc in range(par.c[i] + 1, idx.n_j + 1):
-            m.addConstr(var.w[i, jc] == 0, name=f"A17_forbid_w_i{i}_jc{jc}")
+    # Optional: forbid selecting jc > c[i] (since w may be defined over a larger range)
+    m.addConstrs(
+        (var.w[i, jc] == 0 for i in idx.I for jc in range(par.c[i] + 1, idx.n_j + 1)),
+        name="A17_forbid_w",
+    )
 
 
 def add_A18_workload_uniqueness(m: Model, idx: Indices, par: Parameters, var: Vars) -> None:
@@ -373,26 +441,33 @@ def add_A19_committee_days_definition(m: Model, idx: Indices, par: Parameters, v
     (A.19) Definition of yhat (one-hot per day):
         sum_{jc=0..c[i]} jc * yhat[i,jc,k]
           =
-        sum_{j,t,ell,p} x[i,j,t,k,ell,p]
+        sum_{j,t,ell,p} x[i,j,t,k,ell,p] = sum_{ell,p} y_mem[i,k,ell,p]
     for all i,k.
+
+    Written over y_mem, which A.12 already defines as the (j,t) aggregate of x,
+    so the full x enumeration is not rebuilt per (i,k). Requires A.12 in the
+    same model.
     """
     idx.validate(); par.validate(idx)
 
-    for i in idx.I:
-        jcounts = range(0, par.c[i] + 1)
-
-        for k in idx.K:
-            lhs = quicksum(jc * var.yhat[i, jc, k] for jc in jcounts)
-            rhs = quicksum(
-                var.x[i, j, t, k, ell, p]
-                for j in idx.J for t in idx.T for ell in idx.L for p in idx.P
-            )
-
-            m.addConstr(lhs == rhs, name=f"A19_yhat_def_i{i}_k{k}")
+    m.addConstrs(
+        (
+            quicksum(jc * var.yhat[i, jc, k] for jc in range(0, par.c[i] + 1))
+            ==
+            quicksum(var.y_mem[i, k, ell, p] for ell in idx.L for p in idx.P)
+            for i in idx.I for k in idx.K
+        ),
+        name="A19_yhat_def",
+    )
 
-            # Optional: forbid selecting jc > c[i]
-            for jc in range(par.c[i] + 1, idx.n_j + 1):
-                m.addConstr(var.yhat[i, jc, k] == 0, name=f"A19_forbid_yhat_i{i}_k{k}_jc{jc}")
+    # Optional: forbid selecting jc > c[i]
+    m.addConstrs(
+        (
+            var.yhat[i, jc, k] == 0
+            for i in idx.I for k in idx.K for jc in range(par.c[i] + 1, idx.n_j + 1)
+        ),
+        name="A19_forbid_yhat",
+    )
 
 
 def add_A20_committee_days_uniqueness(m: Model, idx: Indices, par: Parameters, var: Vars) -> None:
@@ -419,11 +494,15 @@ def add_A21_days_count_definition(m: Model, idx: Indices, par: Parameters, var:
     """
     idx.validate(); par.validate(idx)
 
-    for i in idx.I:
-        lhs = quicksum(kc * var.wbar[i, kc] for kc in idx.K0)
-        rhs = quicksum(var.yhat[i, jc, k] for jc in range(1, par.c[i] + 1) for k in idx.K)
-
-        m.addConstr(lhs == rhs, name=f"A21_wbar_def_i{i}")
+    m.addConstrs(
+        (
+            quicksum(kc * var.wbar[i, kc] for kc in idx.K0)
+            ==
+            quicksum(var.yhat[i, jc, k] for jc in range(1, par.c[i] + 1) for k in idx.K)
+            for i in idx.I
+        ),
+        name="A21_wbar_def",
+    )
 
 
 def add_A22_days_count_uniqueness(m: Model, idx: Indices, var: Vars) -> None:
@@ -442,7 +521,9 @@ def add_A22_days_count_uniqueness(m: Model, idx: Indices, var: Vars) -> None:
 # A.23 - A.26 Room-change penalty
 # =============================================================================
 
-def add_A23_A26_room_change_penalty(m: Model, idx: Indices, par: Parameters, var: Vars) -> None:
+def add_A23_A26_room_change_penalty(
+    m: Model, idx: Indices, par: Parameters, var: Vars, *, names: bool = False
+) -> None:
     """
     (A.23)-(A.26) Room-change penalty big-M formulation for the product:
         shat_roomchg[i,k,ell,p] = y_now * prev_sum
@@ -467,61 +548,148 @@ def add_A23_A26_room_change_penalty(m: Model, idx: Indices, par: Parameters, var
       - A.25 and A.26 apply only for ell = d..n_ell
         (so for ell < d, do NOT force shat=0; just skip A25/A26).
 
+    Local big-M: at slot ell only the previous slots ell-d-lbar >= 1 exist, so
+        prev_sum <= M_local[i,ell] = sum_{lbar : ell-d-lbar >= 1} h[i][lbar] <= M_hi
+    and A.24/A.26 use M_local. Where M_local = 0 (no previous slot with
+    h > 0, in particular every ell <= d) the product is exactly 0: those shat
+    are not created at all (build_variables), so they have no rows either.
+
+    Disaggregation: prev_sum = sum_lbar h[i][lbar] * P_lbar with
+    P_lbar = sum_{pbar != p} y_mem[i,k,ell-d-lbar,pbar] in {0,1}. When two or
+    more lbar contribute, the product is split into one part per lbar,
+        shat_part[i,k,ell,p,lbar] = h[i][lbar] * (y_now * P_lbar)
+        shat_roomchg[i,k,ell,p]   = sum_lbar shat_part[i,k,ell,p,lbar]
+    each with its own (A.24)-(A.26) envelope (big-M = h[i][lbar]). Summed, these
+    imply the aggregated rows and give a tighter LP relaxation. With a single
+    contributing lbar the aggregated rows already are that envelope.
+
     Also: A.26 must be a LOWER bound (>=) for the correct product linearization.
           The paper has a direction typo there.
+
+    These are the largest row families of the model, so they are added
+    unnamed unless names=True (e.g. for writing an LP file or an IIS).
     """
     idx.validate(); par.validate(idx)
 
     d = par.d
 
-    for i in idx.I:
-        a_i = par.a[i]  # 0..d-1
+    def _name(family: str) -> str:
+        return family if names else ""
+
+    # lbar = 0..a[i] with h[i][lbar] != 0 (zero weights add no terms)
+    nz_lbars = {
+        i: [lbar for lbar in range(0, par.a[i] + 1) if par.h[i][lbar] != 0]
+        for i in idx.I
+    }
+
+    # Big-M for room-change at slot ell: sum of h[i][lbar] over existing previous slots.
+    # build_variables only creates shat where it is > 0.
+    M_local = room_change_big_m(idx, par)
+
+    # (A.23) shat >= 0  (usually already by variable lower bound, but we keep it explicit we remove it to make it faster)
+
+    # prev_sum only uses valid previous slots (ell - d - lbar >= 1). Each
+    # slot's room variables are looked up once; every p then takes the
+    # pbar != p ones as plain variable lists, grouped per lbar as (lbar, P_lbar).
+    slot_rooms = {
+        (i, k, ell): [(pbar, var.y_mem[i, k, ell, pbar]) for pbar in idx.P]
+        for i in idx.I for k in idx.K for ell in idx.L
+    }
+
+    def _prev_groups(i: int, k: int, ell: int, p: int) -> List[Tuple[int, list]]:
+        groups = []
+        for lbar in nz_lbars[i]:
+            if (ell - d - lbar) < 1:
+                break
+            groups.append((lbar, [y for pbar, y in slot_rooms[i, k, ell - d - lbar] if pbar != p]))
+        return groups
+
+    # M_local > 0 implies ell >= d + 1, so every key here is also in the paper's A.25/A.26 range
+    prev_groups = {
+        (i, k, ell, p): _prev_groups(i, k, ell, p)
+        for i in idx.I for k in idx.K for ell in idx.L for p in idx.P
+        if M_local[i, ell] > 0
+    }
+    single = [key for key, groups in prev_groups.items() if len(groups) == 1]
+    parts = [key + (lbar,) for key, groups in prev_groups.items() if len(groups) > 1 for lbar, _ in groups]
+
+    def _prev_sum(i: int, k: int, ell: int, p: int) -> LinExpr:
+        h_i = par.h[i]
+        coeffs, ys = [], []
+        for lbar, ys_l in prev_groups[i, k, ell, p]:
+            coeffs.extend([h_i[lbar]] * len(ys_l))
+            ys.extend(ys_l)
+        return LinExpr(coeffs, ys)
+
+    # (A.24) shat <= M_local * y_now
+    m.addConstrs(
+        (
+            var.shat_roomchg[i, k, ell, p] <= M_local[i, ell] * var.y_mem[i, k, ell, p]
+            for (i, k, ell, p) in single
+        ),
+        name=_name("A24_roomchg_ub1"),
+    )
 
-        # Big-M for room-change: sum_{lbar=0..a_i} h[i][lbar]
-        M_hi = 0
-        if par.h[i]:
-            M_hi = sum(par.h[i][lbar] for lbar in range(0, a_i + 1))
+    # (A.25) shat <= prev_sum
+    m.addConstrs(
+        (var.shat_roomchg[key] <= _prev_sum(*key) for key in single),
+        name=_name("A25_roomchg_ub2"),
+    )
 
-        for k in idx.K:
-            for ell in idx.L:
-                for p in idx.P:
-                    y_now = var.y_mem[i, k, ell, p]
-
-                    # (A.23) shat >= 0  (usually already by variable lower bound, but we keep it explicit we remove it to make it faster)
-                    #m.addConstr(
-                       # var.shat_roomchg[i, k, ell, p] >= 0,
-                        #name=f"A23_roomchg_nonneg_i{i}_k{k}_ell{ell}_p{p}",
-                   # )
-
-                    # (A.24) shat <= n_hi * y_now   (A.24 applies for ALL ell)
-                    m.addConstr(
-                        var.shat_roomchg[i, k, ell, p] <= M_hi * y_now,
-                        name=f"A24_roomchg_ub1_i{i}_k{k}_ell{ell}_p{p}",
-                    )
-
-                    # A.25 and A.26: only for ell = d..n_ell (paper)
-                    if ell < d:
-                        continue
-
-                    # Build prev_sum with valid previous slots (ell - d - lbar >= 1)
-                    prev_sum = quicksum(
-                        par.h[i][lbar] * quicksum(
-                            var.y_mem[i, k, ell - d - lbar, pbar]
-                            for pbar in idx.P if pbar != p
-                        )
-                        for lbar in range(0, a_i + 1)
-                        if (ell - d - lbar) >= 1
-                    )
-
-                    # (A.25) shat <= prev_sum
-                    m.addConstr(
-                        var.shat_roomchg[i, k, ell, p] <= prev_sum,
-                        name=f"A25_roomchg_ub2_i{i}_k{k}_ell{ell}_p{p}",
-                    )
-
-                    # (A.26) shat >= prev_sum - M_hi*(1 - y_now)   ✅ LOWER bound
-                    m.addConstr(
-                        var.shat_roomchg[i, k, ell, p] >= prev_sum - M_hi * (1 - y_now),
-                        name=f"A26_roomchg_lb_i{i}_k{k}_ell{ell}_p{p}",
-                    )
+    # (A.26) shat >= prev_sum - M_local*(1 - y_now)   ✅ LOWER bound
+    # The right-hand side is assembled directly as prev_sum + M*y_now - M
+    # (one LinExpr per row instead of the 1 - y, M*(...) and difference temporaries).
+    def _a26_rhs(i: int, k: int, ell: int, p: int) -> LinExpr:
+        M = M_local[i, ell]
+        rhs = _prev_sum(i, k, ell, p)
+        rhs.add(var.y_mem[i, k, ell, p], M)
+        rhs.addConstant(-M)
+        return rhs
+
+    m.addConstrs(
+        (var.shat_roomchg[key] >= _a26_rhs(*key) for key in single),
+        name=_name("A26_roomchg_lb"),
+    )
+
+    if not parts:
+        return
+
+    # Disaggregated rows: one (A.24)-(A.26) envelope per contributing lbar
+    P_l = {(i, k, ell, p, lbar): ys_l for (i, k, ell, p), groups in prev_groups.items() for lbar, ys_l in groups}
+    shat_part = m.addVars(parts, vtype=GRB.CONTINUOUS, lb=0.0, name=_name("shat_part"))
+
+    m.addConstrs(
+        (
+            var.shat_roomchg[i, k, ell, p] == quicksum(shat_part[i, k, ell, p, lbar] for lbar, _ in prev_groups[i, k, ell, p])
+            for (i, k, ell, p) in prev_groups
+            if len(prev_groups[i, k, ell, p]) > 1
+        ),
+        name=_name("A23_roomchg_parts"),
+    )
+    h = par.h
+    m.addConstrs(
+        (
+            shat_part[i, k, ell, p, lbar] <= h[i][lbar] * var.y_mem[i, k, ell, p]
+            for (i, k, ell, p, lbar) in parts
+        ),
+        name=_name("A24_roomchg_part_ub1"),
+    )
+    m.addConstrs(
+        (
+            shat_part[i, k, ell, p, lbar] <= LinExpr([h[i][lbar]] * len(P_l[i, k, ell, p, lbar]), P_l[i, k, ell, p, lbar])
+            for (i, k, ell, p, lbar) in parts
+        ),
+        name=_name("A25_roomchg_part_ub2"),
+    )
 
+    def _a26_part_rhs(i: int, k: int, ell: int, p: int, lbar: int) -> LinExpr:
+        h_il = h[i][lbar]
+        ys_l = P_l[i, k, ell, p, lbar]
+        rhs = LinExpr([h_il] * (len(ys_l) + 1), ys_l + [var.y_mem[i, k, ell, p]])
+        rhs.addConstant(-h_il)
+        return rhs
+
+    m.addConstrs(
+        (shat_part[key] >= _a26_part_rhs(*key) for key in parts),
+        name=_name("A26_roomchg_part_lb"),
+    )
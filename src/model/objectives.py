@@ -1,10 +1,12 @@
 # src/model/objectives.py
 from __future__ import annotations
 
-from gurobipy import Model, quicksum, GRB
+import numpy as np
+from gurobipy import LinExpr, Model, quicksum, GRB
 
 from src.common.symbols import Indices
 from src.common.parameters import Parameters
+from src.common.bounds import member_caps, suitability_pairs, tbar_total
 from src.model.variables import Vars
 
 
@@ -59,7 +61,7 @@ def set_objective_28_maximise_research_subject_coverage(m: Model, idx: Indices,
     par.validate(idx)
 
     # Denominator is a positive constant (data only). Including it is optional (doesn't change argmax).
-    denom = sum(par.tbar[j][q] for j in idx.J for q in idx.Q)
+    denom = tbar_total(par)
     if denom <= 0:
         # No subjects at all => objective is meaningless; safest is maximize 0.
         m.setObjective(0.0, GRB.MAXIMIZE)
@@ -87,19 +89,20 @@ def set_objective_29_maximise_committee_member_suitability(m: Model, idx: Indice
     REQUIRED CONSTRAINTS:
     - No special constraints for linearity (r and tbar are constants).
     - Feasibility constraints (A.1)-(A.9) should already exist so x represents valid assignments.
+    - add_xbar_definition (the objective is written over xbar).
     """
     idx.validate()
     par.validate(idx)
 
-    obj = quicksum(
-        par.r[i][q] * par.tbar[j][q] * var.x[i, j, t, k, ell, p]
-        for i in idx.I
-        for q in idx.Q
-        for j in idx.J
-        for t in idx.T
-        for k in idx.K
-        for ell in idx.L
-        for p in idx.P
+    # sum_q r[i,q] * tbar[j,q] = R[i,j] does not depend on (t,k,ell,p), and
+    # xbar[i,j,t] already sums x over (k,ell,p) (add_xbar_definition), so
+    #     z3 = sum_{i,j,t} R[i,j] * xbar[i,j,t]
+    # with one term per (i,j,t) where R[i,j] != 0.
+    nz = suitability_pairs(par)
+    obj = LinExpr()
+    obj.addTerms(
+        [R_ij for _, _, R_ij in nz for t in idx.T],
+        [var.xbar[i, j, t] for i, j, _ in nz for t in idx.T],
     )
 
     m.setObjective(obj, GRB.MAXIMIZE)
@@ -120,15 +123,15 @@ def set_objective_30_minimise_non_consecutive_assignments(m: Model, idx: Indices
     par.validate(idx)
 
     # n_vi per i (max possible compactness contribution per "consecutive opportunity")
-    nvi = {
-        i: sum(par.v[i][lbar] for lbar in range(0, par.b[i] + 1))
-        for i in idx.I
-    }
-
-    term_max_potential = quicksum(
-        par.u[i] * nvi[i] * (j - 1) * var.w[i, j]
-        for i in idx.I
-        for j in idx.J  # MUST start at 1 (avoid j=0 because (j-1) becomes negative)
+    nvi = member_caps(par)[0]
+
+    # u[i] * n_vi * (j-1) for all i, j as one array
+    # (j MUST start at 1: avoid j=0 because (j-1) becomes negative)
+    coef = (par.as_arrays().u[1:] * nvi[1:])[:, None] * (np.arange(1, idx.n_j + 1) - 1)[None, :]
+    term_max_potential = LinExpr()
+    term_max_potential.addTerms(
+        coef.ravel().tolist(),
+        [var.w[i, j] for i in idx.I for j in idx.J],
     )
 
     term_achieved = quicksum(
@@ -155,8 +158,8 @@ def set_objective_31_minimise_time_slot_preference_nonsatisfaction(
     What it penalizes:
     - l=1  => 0 penalty (best slot)
     - l>1  => increasing penalty
-    - l=0  => coefficient becomes negative, so you MUST enforce infeasibility with (A.6),
-             otherwise the solver would exploit it.
+    - l=0  => coefficient would be negative; (A.6) fixes those x to 0, so their terms
+             are left out, but (A.6) is still needed to keep them unassigned.
 
     REQUIRED CONSTRAINTS for correctness:
     - (A.6) Member time slot availability (prevents l=0 assignments)
@@ -165,15 +168,25 @@ def set_objective_31_minimise_time_slot_preference_nonsatisfaction(
     idx.validate()
     par.validate(idx)
 
-    obj = quicksum(
-        par.u[i] * (par.l[i][k][ell] - 1) * var.x[i, j, t, k, ell, p]
-        for i in idx.I
-        for k in idx.K
-        for ell in idx.L
-        for j in idx.J
-        for t in idx.T
-        for p in idx.P
-    )
+    # only slots with l >= 2 contribute: l = 1 has coefficient 0, and l = 0
+    # cells have their x fixed to 0 by (A.6)
+    coeffs = []
+    xs = []
+    for i in idx.I:
+        u_i, l_i = par.u[i], par.l[i]
+        if u_i == 0:
+            continue
+        for k in idx.K:
+            l_ik = l_i[k]
+            for ell in idx.L:
+                if l_ik[ell] < 2:
+                    continue
+                c = u_i * (l_ik[ell] - 1)
+                block = [var.x[i, j, t, k, ell, p] for j, t, p in idx.JTP]
+                xs.extend(block)
+                coeffs.extend([c] * len(block))
+    obj = LinExpr()
+    obj.addTerms(coeffs, xs)
 
     m.setObjective(obj, GRB.MINIMIZE)
 
@@ -228,12 +241,16 @@ def set_objective_33_minimise_room_changes(m: Model, idx: Indices, par: Paramete
     idx.validate()
     par.validate(idx)
 
-    obj = quicksum(
-        par.u[i] * var.shat_roomchg[i, k, ell, p]
-        for i in idx.I
-        for k in idx.K
-        for ell in idx.L
-        for p in idx.P
-    )
+    # shat_roomchg only exists where it can be nonzero
+    u = par.u
+    coeffs = []
+    shats = []
+    for (i, _, _, _), shat in var.shat_roomchg.items():
+        u_i = u[i]
+        if u_i != 0:
+            coeffs.append(u_i)
+            shats.append(shat)
+    obj = LinExpr()
+    obj.addTerms(coeffs, shats)
 
     m.setObjective(obj, GRB.MINIMIZE)
\ No newline at end of file
@@ -5,6 +5,8 @@ from typing import Any
 
 from gurobipy import GRB, Model
 from src.common.symbols import Indices
+from src.common.parameters import Parameters
+from src.common.bounds import room_change_big_m
 
 
 @dataclass(frozen=True)
@@ -22,12 +24,15 @@ class Vars:
 
     s: Any            # s[i,j,q]      (paper: s_ijq, i includes 0)
 
+    # Build-time aggregate (not in the paper): xbar[i,j,t] = sum_{k,ell,p} x[i,j,t,k,ell,p]
+    xbar: Any
+
     # Objective-measure variables:
     sbar_comp: Any    # \bar{s}_{ikℓ}    compactness value (NO room index p)
-    shat_roomchg: Any # \hat{s}_{ikℓp}   room-change value (HAS room index p)
+    shat_roomchg: Any # \hat{s}_{ikℓp}   room-change value (HAS room index p), sparse
 
 
-def build_variables(m: Model, idx: Indices) -> Vars:
+def build_variables(m: Model, idx: Indices, par: Parameters, *, names: bool = False) -> Vars:
     """
     Create all variables from paper Section 2.3.
 
@@ -39,36 +44,48 @@ def build_variables(m: Model, idx: Indices) -> Vars:
     - sbar_comp and shat_roomchg are *penalty measures* used in objectives.
       They do NOT need to be integer to keep correctness of the model.
       Making them CONTINUOUS often speeds up Gurobi (fewer integer vars).
+
+    Only x is named; the auxiliary families are created unnamed unless
+    names=True (e.g. for writing an LP file or an IIS), which saves formatting
+    and storing a name string per variable.
     """
     idx.validate()
 
+    def _name(family: str) -> str:
+        return family if names else ""
+
     # Decision: only real objects
     x = m.addVars(idx.I, idx.J, idx.T, idx.K, idx.L, idx.P,
                   vtype=GRB.BINARY, name="x")
 
     # Aux scheduling indicators
     y_def = m.addVars(idx.J, idx.K, idx.L, idx.P,
-                      vtype=GRB.BINARY, name="y_def")
+                      vtype=GRB.BINARY, name=_name("y_def"))
 
     # paper's \bar{y}_{ikℓp}
     y_mem = m.addVars(idx.I, idx.K, idx.L, idx.P,
-                      vtype=GRB.BINARY, name="y_mem")
+                      vtype=GRB.BINARY, name=_name("y_mem"))
 
     # j includes dummy 0
     yhat = m.addVars(idx.I, idx.J0, idx.K,
-                     vtype=GRB.BINARY, name="yhat")
+                     vtype=GRB.BINARY, name=_name("yhat"))
 
     # j includes dummy 0
     w = m.addVars(idx.I, idx.J0,
-                  vtype=GRB.BINARY, name="w")
+                  vtype=GRB.BINARY, name=_name("w"))
 
     # k includes dummy 0
     wbar = m.addVars(idx.I, idx.K0,
-                     vtype=GRB.BINARY, name="wbar")
+                     vtype=GRB.BINARY, name=_name("wbar"))
 
     # i includes dummy 0
     s = m.addVars(idx.I0, idx.J, idx.Q,
-                  vtype=GRB.BINARY, name="s")
+                  vtype=GRB.BINARY, name=_name("s"))
+
+    # x summed over (k,ell,p), defined by add_xbar_definition. Integral whenever
+    # x is, so CONTINUOUS is enough; lets A.4/A.5/A.10/A.17 reuse one term per (i,j,t).
+    xbar = m.addVars(idx.I, idx.J, idx.T,
+                     vtype=GRB.CONTINUOUS, lb=0.0, name=_name("xbar"))
 
     # ----------------------------------------------------------------------
     # Penalty variables (objective measures)
@@ -80,11 +97,19 @@ def build_variables(m: Model, idx: Indices) -> Vars:
 
     # Compactness penalty: NO room dimension
     sbar_comp = m.addVars(idx.I, idx.K, idx.L,
-                          vtype=GRB.CONTINUOUS, lb=0.0, name="sbar_comp")
-
-    # Room-change penalty: HAS room dimension
-    shat_roomchg = m.addVars(idx.I, idx.K, idx.L, idx.P,
-                             vtype=GRB.CONTINUOUS, lb=0.0, name="shat_roomchg")
+                          vtype=GRB.CONTINUOUS, lb=0.0, name=_name("sbar_comp"))
+
+    # Room-change penalty: HAS room dimension. Only created where the local
+    # big-M is positive; elsewhere no previous slot can contribute and the
+    # product is identically 0 (see add_A23_A26_room_change_penalty).
+    M_local = room_change_big_m(idx, par)
+    shat_keys = [
+        (i, k, ell, p)
+        for i in idx.I for ell in idx.L if M_local[i, ell] > 0
+        for k in idx.K for p in idx.P
+    ]
+    shat_roomchg = m.addVars(shat_keys,
+                             vtype=GRB.CONTINUOUS, lb=0.0, name=_name("shat_roomchg"))
 
     return Vars(
         x=x,
@@ -94,6 +119,7 @@ def build_variables(m: Model, idx: Indices) -> Vars:
         w=w,
         wbar=wbar,
         s=s,
+        xbar=xbar,
         sbar_comp=sbar_comp,
         shat_roomchg=shat_roomchg,
     )
\ No newline at end of file
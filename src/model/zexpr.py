@@ -15,12 +15,14 @@ NOTE (bug fix):
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, List
 
-from gurobipy import LinExpr, quicksum
+import numpy as np
+from gurobipy import LinExpr, Model, quicksum
 
 from src.common.symbols import Indices
 from src.common.parameters import Parameters
+from src.common.bounds import member_caps, suitability_pairs, tbar_total
 from src.model.variables import Vars
 
 
@@ -39,6 +41,9 @@ def build_z_defs(idx: Indices, par: Parameters, var: Vars) -> Dict[int, ZDef]:
     maximize-form rule:
       - if paper objective is MAX: z = expr
       - if paper objective is MIN: z = -expr
+
+    The large MIN objectives (z4, z5, z7) are assembled from coefficient lists
+    with the sign already applied, so no negated copy of the LinExpr is made.
     """
     idx.validate()
     par.validate(idx)
@@ -58,7 +63,8 @@ def build_z_defs(idx: Indices, par: Parameters, var: Vars) -> Dict[int, ZDef]:
     # ------------------------------------------------------------------
     # (28) max subject coverage
     # ------------------------------------------------------------------
-    denom = sum(par.tbar[j][q] for j in idx.J for q in idx.Q)
+    P = par.as_arrays()
+    denom = tbar_total(par)
     if denom <= 0:
         expr28 = LinExpr(0.0)
     else:
@@ -75,15 +81,15 @@ def build_z_defs(idx: Indices, par: Parameters, var: Vars) -> Dict[int, ZDef]:
     # ------------------------------------------------------------------
     # (29) max suitability
     # ------------------------------------------------------------------
-    expr29 = quicksum(
-        par.r[i][q] * par.tbar[j][q] * var.x[i, j, t, k, ell, p]
-        for i in idx.I
-        for q in idx.Q
-        for j in idx.J
-        for t in idx.T
-        for k in idx.K
-        for ell in idx.L
-        for p in idx.P
+    # sum_q r[i,q] * tbar[j,q] = R[i,j] does not depend on (t,k,ell,p), and
+    # xbar[i,j,t] already sums x over (k,ell,p) (add_xbar_definition), so
+    #     z3 = sum_{i,j,t} R[i,j] * xbar[i,j,t]
+    # with one term per (i,j,t) where R[i,j] != 0.
+    nz = suitability_pairs(par)
+    expr29 = LinExpr()
+    expr29.addTerms(
+        [R_ij for _, _, R_ij in nz for t in idx.T],
+        [var.xbar[i, j, t] for i, j, _ in nz for t in idx.T],
     )
 
     # IMPORTANT: NO unary plus on LinExpr
@@ -92,40 +98,46 @@ def build_z_defs(idx: Indices, par: Parameters, var: Vars) -> Dict[int, ZDef]:
     # ------------------------------------------------------------------
     # (30) min non-consecutive assignments
     # ------------------------------------------------------------------
-    nvi = {
-        i: sum(par.v[i][lbar] for lbar in range(0, par.b[i] + 1))
-        for i in idx.I
-    }
-
-    term_max_potential = quicksum(
-        par.u[i] * nvi[i] * (j - 1) * var.w[i, j]
-        for i in idx.I
-        for j in idx.J  # start at 1 to avoid (j-1) negative term for j=0
+    # coefficients u[i] * n_vi * (j-1) over i in I, j in J as one array
+    # (j starts at 1 to avoid a negative (j-1) term for j=0)
+    nvi = member_caps(par)[0]
+    coef = (P.u[1:] * nvi[1:])[:, None] * (np.arange(1, idx.n_j + 1) - 1)[None, :]
+
+    # z4 = -(term_max_potential - term_achieved), built with the signs applied
+    z4 = LinExpr()
+    z4.addTerms(
+        (-coef).ravel().tolist(),
+        [var.w[i, j] for i in idx.I for j in idx.J],
     )
-
-    term_achieved = quicksum(
-        par.u[i] * var.sbar_comp[i, k, ell]
-        for i in idx.I
-        for k in idx.K
-        for ell in idx.L
+    z4.addTerms(
+        [par.u[i] for i in idx.I for k in idx.K for ell in idx.L],
+        [var.sbar_comp[i, k, ell] for i in idx.I for k in idx.K for ell in idx.L],
     )
-
-    expr30 = term_max_potential - term_achieved
-    z[4] = ZDef("z4_non_consecutive", -expr30, "min")
+    z[4] = ZDef("z4_non_consecutive", z4, "min")
 
     # ------------------------------------------------------------------
     # (31) min time-slot preference non-satisfaction
     # ------------------------------------------------------------------
-    expr31 = quicksum(
-        par.u[i] * (par.l[i][k][ell] - 1) * var.x[i, j, t, k, ell, p]
-        for i in idx.I
-        for k in idx.K
-        for ell in idx.L
-        for j in idx.J
-        for t in idx.T
-        for p in idx.P
-    )
-    z[5] = ZDef("z5_timeslot_preference", -expr31, "min")
+    # only slots with l >= 2 contribute: l = 1 has coefficient 0, and l = 0
+    # cells have their x fixed to 0 by (A.6)
+    coeffs = []
+    xs = []
+    for i in idx.I:
+        u_i, l_i = par.u[i], par.l[i]
+        if u_i == 0:
+            continue
+        for k in idx.K:
+            l_ik = l_i[k]
+            for ell in idx.L:
+                if l_ik[ell] < 2:
+                    continue
+                c = u_i * (l_ik[ell] - 1)
+                block = [var.x[i, j, t, k, ell, p] for j, t, p in idx.JTP]
+                xs.extend(block)
+                coeffs.extend([-c] * len(block))
+    z5 = LinExpr()
+    z5.addTerms(coeffs, xs)  # -expr31
+    z[5] = ZDef("z5_timeslot_preference", z5, "min")
 
     # ------------------------------------------------------------------
     # (32) min committee days
@@ -140,13 +152,72 @@ def build_z_defs(idx: Indices, par: Parameters, var: Vars) -> Dict[int, ZDef]:
     # ------------------------------------------------------------------
     # (33) min room changes
     # ------------------------------------------------------------------
-    expr33 = quicksum(
-        par.u[i] * var.shat_roomchg[i, k, ell, p]
-        for i in idx.I
-        for k in idx.K
-        for ell in idx.L
-        for p in idx.P
-    )
-    z[7] = ZDef("z7_room_changes", -expr33, "min")
+    # shat_roomchg only exists where it can be nonzero
+    u = par.u
+    coeffs = []
+    shats = []
+    for (i, _, _, _), shat in var.shat_roomchg.items():
+        u_i = u[i]
+        if u_i != 0:
+            coeffs.append(-u_i)
+            shats.append(shat)
+    z7 = LinExpr()
+    z7.addTerms(coeffs, shats)  # -expr33
+    z[7] = ZDef("z7_room_changes", z7, "min")
+
+    return z
 
-    return z
\ No newline at end of file
+
+@dataclass(frozen=True)
+class ZEvaluator:
+    """
+    z_1..z_n compiled to one flat (row, column, coefficient) list over the
+    variables that appear in any objective.
+
+    Evaluating all objectives after a solve then needs ONE getAttr("X") call
+    over those variables and ONE weighted bincount, instead of n_z
+    LinExpr.getValue() walks. (A dense n_z x n_vars matrix is not used: LARGE
+    instances have millions of columns, almost all zero in every z_i.)
+    """
+    model_vars: list               # variables referenced by some z_i (unique)
+    rows: np.ndarray               # objective index 0..n_z-1 per term
+    cols: np.ndarray               # per term, index into model_vars
+    coeffs: np.ndarray             # per term
+    const: np.ndarray              # per objective
+
+    def values(self, m: Model) -> List[float]:
+        x = np.asarray(m.getAttr("X", self.model_vars), dtype=np.float64)
+        z = np.bincount(self.rows, weights=self.coeffs * x[self.cols], minlength=self.const.shape[0])
+        return (z + self.const).tolist()
+
+
+def compile_z_evaluator(m: Model, z_defs: Dict[int, ZDef], n_z: int = 7) -> ZEvaluator:
+    """
+    Walk each z_i LinExpr once and store its terms in flat arrays.
+    The model must be updated (Var.index is only valid after m.update()).
+    """
+    m.update()
+
+    rows: List[np.ndarray] = []
+    coeffs: List[np.ndarray] = []
+    cols: List[np.ndarray] = []
+    const = np.zeros(n_z, dtype=np.float64)
+    for i in range(1, n_z + 1):
+        expr = z_defs[i].expr
+        n = expr.size()
+        rows.append(np.full(n, i - 1, dtype=np.int64))
+        coeffs.append(np.fromiter((expr.getCoeff(t) for t in range(n)), dtype=np.float64, count=n))
+        cols.append(np.fromiter((expr.getVar(t).index for t in range(n)), dtype=np.int64, count=n))
+        const[i - 1] = float(expr.getConstant())
+
+    all_cols = np.concatenate(cols) if cols else np.zeros(0, dtype=np.int64)
+    used, local = np.unique(all_cols, return_inverse=True)
+    all_vars = m.getVars()
+
+    return ZEvaluator(
+        model_vars=[all_vars[c] for c in used.tolist()],
+        rows=np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64),
+        cols=local.astype(np.int64),
+        coeffs=np.concatenate(coeffs) if coeffs else np.zeros(0, dtype=np.float64),
+        const=const,
+    )
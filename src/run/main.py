@@ -4,6 +4,7 @@ from __future__ import annotations
 from src.common.symbols import Indices
 from src.common.parameters import Parameters
 from src.common.solve_tracker import SolveTracker
+from src.model.build import build_stage2_base
 
 from src.algorithms.stage1_g import solve_g_star
 from src.algorithms.ideal_nadir import compute_ideal_and_approx_nadir
@@ -35,6 +36,9 @@ def run_two_stage(
     # PAPER settings (Section 6.1.3)
     bounded_objectives: tuple[int, ...] = (3, 4),
     fully_considered_objective: int = 1,
+
+    # Algorithm 5 parallel mode: worker processes (1 = serial)
+    n_workers: int = 1,
 ):
     """
     Runs the full paper pipeline:
@@ -52,6 +56,14 @@ def run_two_stage(
 
     If BOTH are provided:
       - we prioritize paper budget mode (total_time_budget_eps).
+
+    n_workers > 1 solves the Algorithm 1 and Algorithm 5 subproblems in that
+    many processes.
+
+    Serially, the Stage-2 model (fixed g) is built once and shared by
+    Algorithm 1 and Algorithm 5, then disposed here. Algorithm 1 hands it
+    over with its TimeLimit / LPWarmStart restored and no MIP start, so the
+    first ε solve is not seeded with an Algorithm 1 solution.
     """
 
     idx.validate()
@@ -69,29 +81,62 @@ def run_two_stage(
         tracker=tracker,
     )
 
-    # ================================================================
-    # Stage 2 — Algorithm 1 (Ideal + Approximate Nadir)
-    # ================================================================
-    in_res = compute_ideal_and_approx_nadir(
-        idx,
-        par,
-        g_star,
-        n_z=n_z,
-        time_limit=time_limit_ideal,
-        tracker=tracker,
-    )
-
-    # ================================================================
-    # Stage 2 — Algorithm 5 (Augmented ε-constraint)
-    # ================================================================
-    steps = [steps_per_obj] * len(bounded_objectives)
+    # Stage 2 feasible region X (fixed g): built once, shared by Alg.1 / Alg.5
+    # (named when debug_iis is set, so Alg.5 can reuse it for readable IIS files)
+    base = build_stage2_base(idx, par, g_star, name="P", names=debug_iis) if n_workers <= 1 else None
 
-    # choose mode
-    total_budget = total_time_budget_eps if total_time_budget_eps is not None else None
-    per_iter_tl = None if total_budget is not None else time_limit_eps
+    try:
+        # ================================================================
+        # Stage 2 — Algorithm 1 (Ideal + Approximate Nadir)
+        # ================================================================
+        in_res = compute_ideal_and_approx_nadir(
+            idx,
+            par,
+            g_star,
+            n_z=n_z,
+            time_limit=time_limit_ideal,
+            tracker=tracker,
+            base=base,
+            n_workers=n_workers,
+        )
 
-    if return_metrics:
-        N, I, metrics = solve_augmented_epsilon(
+        # ================================================================
+        # Stage 2 — Algorithm 5 (Augmented ε-constraint)
+        # ================================================================
+        steps = [steps_per_obj] * len(bounded_objectives)
+
+        # choose mode
+        total_budget = total_time_budget_eps if total_time_budget_eps is not None else None
+        per_iter_tl = None if total_budget is not None else time_limit_eps
+
+        if return_metrics:
+            N, I, metrics = solve_augmented_epsilon(
+                idx,
+                par,
+                g_star,
+                in_res.z_ideal,
+                in_res.z_nadir,
+                steps,
+                n_z=n_z,
+                bounded_objectives=bounded_objectives,
+                fully_considered_objective=fully_considered_objective,
+
+                # Alg.5 time control:
+                total_time_budget=total_budget,
+                time_limit_per_iter=per_iter_tl,
+
+                return_metrics=True,
+                tracker=tracker,
+
+                accept_time_limit_incumbent=accept_time_limit_incumbent,
+                debug_iis=debug_iis,
+                iis_dir=iis_dir,
+                n_workers=n_workers,
+                base=base,
+            )
+            return g_star, in_res, N, I, metrics
+
+        N, I = solve_augmented_epsilon(
             idx,
             par,
             g_star,
@@ -102,38 +147,20 @@ def run_two_stage(
             bounded_objectives=bounded_objectives,
             fully_considered_objective=fully_considered_objective,
 
-            # Alg.5 time control:
             total_time_budget=total_budget,
             time_limit_per_iter=per_iter_tl,
 
-            return_metrics=True,
+            return_metrics=False,
             tracker=tracker,
-
             accept_time_limit_incumbent=accept_time_limit_incumbent,
             debug_iis=debug_iis,
             iis_dir=iis_dir,
+            n_workers=n_workers,
+            base=base,
         )
-        return g_star, in_res, N, I, metrics
 
-    N, I = solve_augmented_epsilon(
-        idx,
-        par,
-        g_star,
-        in_res.z_ideal,
-        in_res.z_nadir,
-        steps,
-        n_z=n_z,
-        bounded_objectives=bounded_objectives,
-        fully_considered_objective=fully_considered_objective,
-
-        total_time_budget=total_budget,
-        time_limit_per_iter=per_iter_tl,
-
-        return_metrics=False,
-        tracker=tracker,
-        accept_time_limit_incumbent=accept_time_limit_incumbent,
-        debug_iis=debug_iis,
-        iis_dir=iis_dir,
-    )
+        return g_star, in_res, N, I
 
-    return g_star, in_res, N, I
\ No newline at end of file
+    finally:
+        if base is not None:
+            base.m.dispose()
@@ -57,7 +57,7 @@ def main():
         inst_dir = Path(args.instance_dir)
         inst_dir.mkdir(parents=True, exist_ok=True)
 
-        name = args.instance_name or f"inst_test_seed{args.seed}_ni{size.n_i}_nj{size.n_j}.json"
+        name = args.instance_name or f"inst_test_seed{args.seed}_ni{size.n_i}_nj{size.n_j}.npz"
         inst_path = inst_dir / name
 
         save_instance(inst_path, idx, par)
@@ -90,13 +90,13 @@ def main():
 
     # print("\n=== NON-DOMINATED SOLUTIONS (N) ===")
     # for k, sol in enumerate(N, 1):
-    #     print(f"Solution {k}: z={sol.z} eps={sol.eps}")
+    #     print(f"Solution {k}: z={sol.z.tolist()} eps={sol.eps.tolist()}")
 
     print("\n=== NON-DOMINATED SOLUTIONS (N) ===")
     for k, sol in enumerate(N, 1):
         print(f"\n--- Solution {k} ---")
-        print(f"z={sol.z}")
-        print(f"eps={sol.eps}")
+        print(f"z={sol.z.tolist()}")
+        print(f"eps={sol.eps.tolist()}")
         print(f"proven={sol.proven} status={sol.status}")
         print("Schedule:")
         pretty_print_defence_blocks(sol.schedule or [])
@@ -127,8 +127,8 @@ def main():
         "timeI": round(metrics.timeI, 4),
         "z_ideal": str(in_res.z_ideal),
         "z_nadir": str(in_res.z_nadir),
-        "N_solutions": str([sol.z for sol in N]),
-        "N_eps": str([sol.eps for sol in N]),
+        "N_solutions": str([sol.z.tolist() for sol in N]),
+        "N_eps": str([sol.eps.tolist() for sol in N]),
     }
 
     write_header = not os.path.exists(out_csv)